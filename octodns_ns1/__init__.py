@@ -2,47 +2,224 @@
 #
 #
 
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, namedtuple
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from itertools import chain
 from logging import getLogger
-from time import sleep
+from operator import attrgetter
+from re import compile as re_compile
+from threading import Lock
+from time import monotonic, sleep
+from types import MappingProxyType
 from uuid import uuid4
 
 from ns1 import NS1
 from ns1.rest.errors import RateLimitException, ResourceException
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from octodns.provider import ProviderException, SupportsException
 from octodns.provider.base import BaseProvider
-from octodns.record import Create, Record, Update
+from octodns.record import Create, Delete, Record, Update
 from octodns.record.geo import GeoCodes
 from octodns.record.geo_data import geo_data
 
 # TODO: remove __VERSION__ with the next major version release
 __version__ = __VERSION__ = '0.0.7'
 
+# Notes are space separated key:value pieces, pieces without a `:` are
+# ignored and values may include `:`s
+_NOTE_PIECE_RE = re_compile(r'(?<![^ ])([^ :]*):([^ ]*)')
+_NOTE_INT_RE = re_compile(r'[-+]?\d+')
+
+# HTTP versions the legacy HTTP-emulating TCP monitors can send, a tuple
+# rather than a set so that errors list them in a stable order
+_ACCEPTABLE_HTTP_VERSIONS = ('HTTP/1.0', 'HTTP/1.1')
+
+# Shared, read-only, stand-in for a domain we have no record filters for
+_NO_RECORD_FILTERS = MappingProxyType({})
+
+
+# The same notes show up over and over again, on every answer of a pool, every
+# region of a rule, and every monitor, and parsing them is pure so cache the
+# results. They're shared so they're returned read-only.
+@lru_cache(maxsize=4096)
+def _parse_notes(note):
+    data = {}
+    if note:
+        for k, v in _NOTE_PIECE_RE.findall(note):
+            if _NOTE_INT_RE.fullmatch(v):
+                v = int(v)
+            data[k] = v if v != '' else None
+    return MappingProxyType(data)
+
+
+# Likewise the notes we generate, e.g. the `from:--default--` on every default
+# answer, are built from a handful of distinct (sorted) items
+@lru_cache(maxsize=4096)
+def _encode_note_items(items):
+    return ' '.join([f'{k}:{v}' for k, v in items])
+
+
+def _monitor_host_type(monitor):
+    # the (host, type) of the record a monitor belongs to, per its notes
+    data = _parse_notes(monitor.get('notes'))
+    if not data:
+        return None
+    return (data.get('host'), data.get('type'))
+
+
+# A pool value's answer details, built once per value by _generate_answers
+# and then read for each region the pool (or a fallback to it) answers
+_PoolAnswer = namedtuple(
+    '_PoolAnswer', ('answer', 'weight', 'feed_id', 'status')
+)
+
 
 def _ensure_endswith_dot(string):
     return string if string.endswith('.') else f'{string}.'
 
 
+def _thaw_filter_chain(filter_chain):
+    # mutable copy of a (frozen) filter chain, suitable for sending to the API
+    return [
+        {k: dict(v) if isinstance(v, Mapping) else v for k, v in f.items()}
+        for f in filter_chain
+    ]
+
+
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _filter_chain_fingerprint(filter_chain):
+    # hashable equivalent of a filter chain, equal when the chains are
+    return tuple(_freeze(f) for f in filter_chain)
+
+
+def _zone_record_from(record):
+    # The records list of a zone only includes summary information, convert
+    # the full record details we get back from the API into that shape
+    answers = record.get('answers', [])
+    advanced = bool(record.get('filters')) or any(
+        a.get('meta') for a in answers
+    )
+    return {
+        'domain': record['domain'],
+        'short_answers': [
+            ' '.join(str(v) for v in a['answer']) for a in answers
+        ],
+        'tier': record.get('tier', 3 if advanced else 1),
+        'ttl': record['ttl'],
+        'type': record['type'],
+    }
+
+
 class Ns1Exception(ProviderException):
     pass
 
 
+class TokenBucket(object):
+    '''
+    Client-side mirror of NS1's rate limiting token bucket. Until we've seen
+    the limits advertised by the API in response headers it's a no-op. After
+    that tokens are acquired before each request, sleeping off any debt at the
+    bucket's refill rate rather than waiting for a 429.
+    '''
+
+    log = getLogger('NS1TokenBucket')
+
+    def __init__(self):
+        self.capacity = None
+        self.rate = None
+        self.tokens = 0.0
+        self.last_refill = monotonic()
+        self._lock = Lock()
+
+    def _refill(self):
+        now = monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    def tune(self, limit, period, remaining):
+        if not limit or not period:
+            return False
+        with self._lock:
+            self.capacity = float(limit)
+            self.rate = self.capacity / float(period)
+            self.last_refill = monotonic()
+            # NS1's count is authoritative, it sees every client using the key
+            self.tokens = min(self.capacity, float(remaining or 0))
+        return True
+
+    def penalize(self):
+        with self._lock:
+            if self.rate is None:
+                return False
+            self.tokens = min(self.tokens - self.rate, -1.0)
+        return True
+
+    def acquire(self):
+        with self._lock:
+            if self.rate is None:
+                return
+            self._refill()
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            self.log.debug('acquire: pacing for %.2fs', wait)
+            sleep(wait)
+
+    def rate_limit_headers(self, func):
+        # wraps the SDK's parsing of the rate limit headers so that we see the
+        # limits reported on every response. When the headers are missing the
+        # SDK fills in made up defaults, those aren't limits so don't tune
+        def rate_limit_headers(headers):
+            rl = func(headers)
+            if (
+                'X-RateLimit-Limit' in headers
+                and 'X-RateLimit-Period' in headers
+            ):
+                self.tune(rl['limit'], rl['period'], rl['remaining'])
+            return rl
+
+        return rate_limit_headers
+
+
 class Ns1Client(object):
     log = getLogger('NS1Client')
 
+    MAX_PARALLELISM = 16
+    ZONE_NOT_FOUND_MESSAGE = 'server error: zone not found'
+
     def __init__(
-        self, api_key, parallelism=None, retry_count=4, client_config=None
+        self,
+        api_key,
+        parallelism=None,
+        retry_count=4,
+        client_config=None,
+        fetch_workers=1,
+        apply_workers=1,
     ):
         self.log.debug(
-            '__init__: parallelism=%s, retry_count=%d, client_config=%s',
+            '__init__: parallelism=%s, retry_count=%d, client_config=%s, '
+            'fetch_workers=%d, apply_workers=%d',
             parallelism,
             retry_count,
             client_config,
+            fetch_workers,
+            apply_workers,
         )
         self.retry_count = retry_count
+        self.fetch_workers = fetch_workers
+        self.apply_workers = apply_workers
 
         client = NS1(apiKey=api_key)
 
@@ -63,9 +240,20 @@ class Ns1Client(object):
         # requests, and subsequently each process will sleep for 18 seconds
         # before making another request.
         # In general, parallelism should match the number of workers.
+        # Parallelism beyond MAX_PARALLELISM won't get more out of the token
+        # bucket, it would just mean more 429s and retries.
         if parallelism is not None:
+            if parallelism > self.MAX_PARALLELISM:
+                self.log.warning(
+                    '__init__: parallelism=%d exceeds the recommended '
+                    'maximum, clamping to %d',
+                    parallelism,
+                    self.MAX_PARALLELISM,
+                )
+                parallelism = self.MAX_PARALLELISM
             client.config['rate_limit_strategy'] = 'concurrent'
             client.config['parallelism'] = parallelism
+        self.parallelism = parallelism
 
         # The list of records for a zone is paginated at around ~2.5k records,
         # this tells the client to handle any of that transparently and ensure
@@ -86,34 +274,83 @@ class Ns1Client(object):
         self._datasource = client.datasource()
         self._datafeed = client.datafeed()
 
+        # Proactively pace our requests to stay within the rate limits rather
+        # than running into 429s and then sleeping for the full period.
+        self._bucket = TokenBucket()
+        # Each of the SDK's resources has its own transport and requests
+        # session. Have them share a connection pool so that connections, and
+        # their TLS handshakes, are reused across all of them and size it so
+        # that concurrent workers don't have to throw their connections away.
+        adapter = HTTPAdapter(
+            pool_maxsize=max(
+                parallelism or 0, fetch_workers, apply_workers, DEFAULT_POOLSIZE
+            )
+        )
+        for resource in (
+            self._records,
+            self._zones,
+            self._monitors,
+            self._notifylists,
+            self._datasource,
+            self._datafeed,
+        ):
+            transport = resource._transport
+            # the SDK's strategies already sleep to pace requests, stay out of
+            # their way rather than pacing everything twice
+            if client.config.get('rate_limit_strategy') is None:
+                transport._rateLimitHeaders = self._bucket.rate_limit_headers(
+                    transport._rateLimitHeaders
+                )
+            # only the requests transport has a session
+            session = getattr(transport, 'session', None)
+            if session is not None:
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+
+        self._zones_lock = Lock()
         self.reset_caches()
 
     def reset_caches(self):
         self._datasource_id = None
         self._feeds_for_monitors = None
+        self._monitors_for_feeds = None
         self._monitors_cache = None
+        self._monitors_by_host_type = None
         self._notifylists_cache = None
+        self._notifylist_names = None
         self._zones_cache = {}
+        self._zone_names = None
+        # zones we've been told don't exist, e.g. by populate, so that apply
+        # doesn't have to ask again before creating them
+        self._missing_zones = set()
+        # (zone, domain, type) -> record
         self._records_cache = {}
 
     def update_record_cache(func):
         def call(self, zone, domain, _type, **params):
-            if zone in self._zones_cache:
-                # remove record's zone from cache
-                del self._zones_cache[zone]
-
-            cached = self._records_cache.setdefault(zone, {}).setdefault(
-                domain, {}
-            )
-
-            if _type in cached:
-                # remove record from cache
-                del cached[_type]
+            key = (zone, domain, _type)
+            # remove record from cache
+            self._records_cache.pop(key, None)
 
             # write record to cache if its not a delete
             new_record = func(self, zone, domain, _type, **params)
             if new_record:
-                cached[_type] = new_record
+                self._records_cache[key] = new_record
+
+            # patch the record into/out of the zone's cached records rather
+            # than throwing away the whole thing and having to refetch it
+            ns1_zone = self._zones_cache.get(zone)
+            if ns1_zone is not None:
+                # applies can run concurrently, don't lose any of them
+                with self._zones_lock:
+                    records = [
+                        r
+                        for r in ns1_zone.get('records', [])
+                        if r['domain'] != domain or r['type'] != _type
+                    ]
+                    if new_record:
+                        records.append(_zone_record_from(new_record))
+                    ns1_zone['records'] = records
 
             return new_record
 
@@ -121,13 +358,13 @@ class Ns1Client(object):
 
     def read_or_set_record_cache(func):
         def call(self, zone, domain, _type):
-            cached = self._records_cache.setdefault(zone, {}).setdefault(
-                domain, {}
-            )
-            if _type not in cached:
-                cached[_type] = func(self, zone, domain, _type)
-
-            return cached[_type]
+            key = (zone, domain, _type)
+            try:
+                return self._records_cache[key]
+            except KeyError:
+                record = func(self, zone, domain, _type)
+                self._records_cache[key] = record
+                return record
 
         return call
 
@@ -165,6 +402,16 @@ class Ns1Client(object):
 
         return self._feeds_for_monitors
 
+    @property
+    def monitors_for_feeds(self):
+        # reverse index of feeds_for_monitors, feed id -> monitor (job) id
+        if self._monitors_for_feeds is None:
+            self._monitors_for_feeds = {
+                v: k for k, v in self.feeds_for_monitors.items()
+            }
+
+        return self._monitors_for_feeds
+
     @property
     def monitors(self):
         if self._monitors_cache is None:
@@ -172,6 +419,32 @@ class Ns1Client(object):
             self._monitors_cache = {m['id']: m for m in self.monitors_list()}
         return self._monitors_cache
 
+    @property
+    def monitors_by_host_type(self):
+        # index of monitors, (host, type) of their record -> [monitor, ...]
+        if self._monitors_by_host_type is None:
+            index = defaultdict(list)
+            for monitor in self.monitors.values():
+                key = _monitor_host_type(monitor)
+                if key is not None:
+                    index[key].append(monitor)
+            self._monitors_by_host_type = dict(index)
+        return self._monitors_by_host_type
+
+    def _monitors_reindex(self, old, new):
+        # keep monitors_by_host_type, if it's been built, in sync
+        index = self._monitors_by_host_type
+        if index is None:
+            return
+        if old is not None:
+            key = _monitor_host_type(old)
+            if key in index:
+                index[key] = [m for m in index[key] if m is not old]
+        if new is not None:
+            key = _monitor_host_type(new)
+            if key is not None:
+                index.setdefault(key, []).append(new)
+
     @property
     def notifylists(self):
         if self._notifylists_cache is None:
@@ -181,16 +454,27 @@ class Ns1Client(object):
             }
         return self._notifylists_cache
 
+    @property
+    def notifylist_names(self):
+        # reverse index of notifylists, notify list id -> name
+        if self._notifylist_names is None:
+            self._notifylist_names = {
+                nl['id']: nl['name'] for nl in self.notifylists.values()
+            }
+        return self._notifylist_names
+
     def datafeed_create(self, sourceid, name, config):
         ret = self._try(self._datafeed.create, sourceid, name, config)
         self.feeds_for_monitors[config['jobid']] = ret['id']
+        if self._monitors_for_feeds is not None:
+            self._monitors_for_feeds[ret['id']] = config['jobid']
         return ret
 
     def datafeed_delete(self, sourceid, feedid):
         ret = self._try(self._datafeed.delete, sourceid, feedid)
-        self._feeds_for_monitors = {
-            k: v for k, v in self._feeds_for_monitors.items() if v != feedid
-        }
+        jobid = self.monitors_for_feeds.pop(feedid, None)
+        if jobid is not None:
+            del self._feeds_for_monitors[jobid]
         return ret
 
     def datafeed_list(self, sourceid):
@@ -206,11 +490,15 @@ class Ns1Client(object):
         body = {}
         ret = self._try(self._monitors.create, body, **params)
         self.monitors[ret['id']] = ret
+        self._monitors_reindex(None, ret)
         return ret
 
     def monitors_delete(self, jobid):
         ret = self._try(self._monitors.delete, jobid)
-        self.monitors.pop(jobid)
+        # no need to fetch the monitors just to remove one from them
+        if self._monitors_cache is not None:
+            old = self._monitors_cache.pop(jobid, None)
+            self._monitors_reindex(old, None)
         return ret
 
     def monitors_list(self):
@@ -219,20 +507,26 @@ class Ns1Client(object):
     def monitors_update(self, job_id, **params):
         body = {}
         ret = self._try(self._monitors.update, job_id, body, **params)
-        self.monitors[ret['id']] = ret
+        monitors = self.monitors
+        old = monitors.get(ret['id'])
+        monitors[ret['id']] = ret
+        self._monitors_reindex(old, ret)
         return ret
 
     def notifylists_delete(self, nlid):
-        for name, nl in self.notifylists.items():
-            if nl['id'] == nlid:
-                del self._notifylists_cache[name]
-                break
+        # no need to fetch the notify lists just to remove one from them
+        if self._notifylists_cache is not None:
+            name = self.notifylist_names.pop(nlid, None)
+            if name is not None:
+                self._notifylists_cache.pop(name, None)
         return self._try(self._notifylists.delete, nlid)
 
     def notifylists_create(self, **body):
         nl = self._try(self._notifylists.create, body)
         # cache it
         self.notifylists[nl['name']] = nl
+        if self._notifylist_names is not None:
+            self._notifylist_names[nl['id']] = nl['name']
         return nl
 
     def notifylists_list(self):
@@ -250,43 +544,90 @@ class Ns1Client(object):
     def records_retrieve(self, zone, domain, _type):
         return self._try(self._records.retrieve, zone, domain, _type)
 
+    def records_retrieve_many(self, zone, domain_types):
+        # Each retrieve is its own round trip, so when we've been told we can
+        # have fetch_workers requests in flight spread them across that many
+        # threads. The token bucket and _try take care of pacing & retries.
+        workers = min(self.fetch_workers, len(domain_types))
+        if workers < 2:
+            return [self.records_retrieve(zone, d, t) for d, t in domain_types]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda dt: self.records_retrieve(zone, *dt), domain_types
+                )
+            )
+
     @update_record_cache
     def records_update(self, zone, domain, _type, **params):
         return self._try(self._records.update, zone, domain, _type, **params)
 
     def zones_create(self, name):
         self._zones_cache[name] = self._try(self._zones.create, name)
+        self._missing_zones.discard(name)
+        if self._zone_names is not None:
+            self._zone_names.add(name)
         return self._zones_cache[name]
 
     def zones_retrieve(self, name):
         if name not in self._zones_cache:
-            self._zones_cache[name] = self._try(self._zones.retrieve, name)
+            if name in self._missing_zones or (
+                self._zone_names is not None and name not in self._zone_names
+            ):
+                # We've listed the zones and this one isn't among them, or
+                # already asked for it, no need to ask the API again
+                raise ResourceException(self.ZONE_NOT_FOUND_MESSAGE)
+            try:
+                self._zones_cache[name] = self._try(self._zones.retrieve, name)
+            except ResourceException as e:
+                if e.message == self.ZONE_NOT_FOUND_MESSAGE:
+                    self._missing_zones.add(name)
+                raise
         return self._zones_cache[name]
 
     def zones_list(self):
-        # TODO: explore caching all of these if they have sufficient details
-        return self._try(self._zones.list)
+        # The listed zones don't include their records so they can't fill in
+        # the zones cache, but they do tell us which zones exist
+        zones = self._try(self._zones.list)
+        self._zone_names = set(z['zone'] for z in zones)
+        return zones
 
     def _try(self, method, *args, **kwargs):
         tries = self.retry_count
         while True:  # We'll raise to break after our tries expire
+            self._bucket.acquire()
             try:
                 return method(*args, **kwargs)
             except RateLimitException as e:
                 if tries <= 1:
                     raise
-                period = float(e.period)
-                self.log.warning(
-                    'rate limit encountered, pausing '
-                    'for %ds and trying again, %d remaining',
-                    period,
-                    tries,
-                )
-                sleep(period)
+                if self._bucket.penalize():
+                    # the bucket is now in debt and the next acquire will
+                    # sleep it off
+                    self.log.warning(
+                        'rate limit encountered, backing off '
+                        'and trying again, %d remaining',
+                        tries,
+                    )
+                else:
+                    # we don't know enough about the limits to pace things,
+                    # wait out the full period
+                    period = float(e.period)
+                    self.log.warning(
+                        'rate limit encountered, pausing '
+                        'for %ds and trying again, %d remaining',
+                        period,
+                        tries,
+                    )
+                    sleep(period)
                 tries -= 1
             except ResourceException as e:
-                if not e.response or e.response.status_code != 404:
-                    self.log.exception(
+                # requests' Response is falsey for error status codes so check
+                # for None explicitly
+                if e.response is None or e.response.status_code != 404:
+                    # The exception is re-raised with its traceback intact for
+                    # whoever handles it, no need to render that here
+                    self.log.error(
                         "_try: method=%s, args=%s, response=%s, body=%s",
                         method.__name__,
                         str(args),
@@ -324,143 +665,148 @@ class Ns1Provider(BaseProvider):
         )
     )
 
-    ZONE_NOT_FOUND_MESSAGE = 'server error: zone not found'
+    # the client raises this for zones it knows are missing, share it so our
+    # checks match those too
+    ZONE_NOT_FOUND_MESSAGE = Ns1Client.ZONE_NOT_FOUND_MESSAGE
     SHARED_NOTIFYLIST_NAME = 'octoDNS NS1 Notify List'
 
-    @property
-    def _UP_FILTER(self):
-        return {'config': {}, 'filter': 'up'}
+    # The filters and filter chains are shared, read-only, constants. Use
+    # _thaw_filter_chain to get a copy that can be sent to the API.
+    _UP_FILTER = MappingProxyType(
+        {'config': MappingProxyType({}), 'filter': 'up'}
+    )
 
-    @property
-    def _REGION_FILTER(self):
-        return {
-            'config': {'remove_no_georegion': True},
+    _REGION_FILTER = MappingProxyType(
+        {
+            'config': MappingProxyType({'remove_no_georegion': True}),
             'filter': u'geofence_regional',
         }
+    )
 
-    @property
-    def _COUNTRY_FILTER(self):
-        return {
-            'config': {'remove_no_location': True},
+    _COUNTRY_FILTER = MappingProxyType(
+        {
+            'config': MappingProxyType({'remove_no_location': True}),
             'filter': u'geofence_country',
         }
+    )
 
-    @property
-    def _SUBNET_FILTER(self):
-        return {
-            'config': {'remove_no_ip_prefixes': True},
+    _SUBNET_FILTER = MappingProxyType(
+        {
+            'config': MappingProxyType({'remove_no_ip_prefixes': True}),
             'filter': u'netfence_prefix',
         }
+    )
 
     # In the NS1 UI/portal, this filter is called "SELECT FIRST GROUP" though
     # the filter name in the NS1 api is 'select_first_region'
-    @property
-    def _SELECT_FIRST_REGION_FILTER(self):
-        return {'config': {}, 'filter': u'select_first_region'}
+    _SELECT_FIRST_REGION_FILTER = MappingProxyType(
+        {'config': MappingProxyType({}), 'filter': u'select_first_region'}
+    )
 
-    @property
-    def _PRIORITY_FILTER(self):
-        return {'config': {'eliminate': u'1'}, 'filter': 'priority'}
+    _PRIORITY_FILTER = MappingProxyType(
+        {'config': MappingProxyType({'eliminate': u'1'}), 'filter': 'priority'}
+    )
 
-    @property
-    def _WEIGHTED_SHUFFLE_FILTER(self):
-        return {'config': {}, 'filter': u'weighted_shuffle'}
+    _WEIGHTED_SHUFFLE_FILTER = MappingProxyType(
+        {'config': MappingProxyType({}), 'filter': u'weighted_shuffle'}
+    )
 
-    @property
-    def _SELECT_FIRST_N_FILTER(self):
-        return {'config': {'N': u'1'}, 'filter': u'select_first_n'}
+    _SELECT_FIRST_N_FILTER = MappingProxyType(
+        {'config': MappingProxyType({'N': u'1'}), 'filter': u'select_first_n'}
+    )
 
-    @property
-    def _BASIC_FILTER_CHAIN(self):
-        return [
-            self._UP_FILTER,
-            self._SELECT_FIRST_REGION_FILTER,
-            self._PRIORITY_FILTER,
-            self._WEIGHTED_SHUFFLE_FILTER,
-            self._SELECT_FIRST_N_FILTER,
-        ]
+    _BASIC_FILTER_CHAIN = (
+        _UP_FILTER,
+        _SELECT_FIRST_REGION_FILTER,
+        _PRIORITY_FILTER,
+        _WEIGHTED_SHUFFLE_FILTER,
+        _SELECT_FIRST_N_FILTER,
+    )
 
-    @property
-    def _FILTER_CHAIN_WITH_REGION(self):
-        return [
-            self._UP_FILTER,
-            self._REGION_FILTER,
-            self._SELECT_FIRST_REGION_FILTER,
-            self._PRIORITY_FILTER,
-            self._WEIGHTED_SHUFFLE_FILTER,
-            self._SELECT_FIRST_N_FILTER,
-        ]
+    _FILTER_CHAIN_WITH_REGION = (
+        _UP_FILTER,
+        _REGION_FILTER,
+        _SELECT_FIRST_REGION_FILTER,
+        _PRIORITY_FILTER,
+        _WEIGHTED_SHUFFLE_FILTER,
+        _SELECT_FIRST_N_FILTER,
+    )
 
-    @property
-    def _FILTER_CHAIN_WITH_COUNTRY(self):
-        return [
-            self._UP_FILTER,
-            self._COUNTRY_FILTER,
-            self._SELECT_FIRST_REGION_FILTER,
-            self._PRIORITY_FILTER,
-            self._WEIGHTED_SHUFFLE_FILTER,
-            self._SELECT_FIRST_N_FILTER,
-        ]
+    _FILTER_CHAIN_WITH_COUNTRY = (
+        _UP_FILTER,
+        _COUNTRY_FILTER,
+        _SELECT_FIRST_REGION_FILTER,
+        _PRIORITY_FILTER,
+        _WEIGHTED_SHUFFLE_FILTER,
+        _SELECT_FIRST_N_FILTER,
+    )
 
-    @property
-    def _FILTER_CHAIN_WITH_SUBNET(self):
-        return [
-            self._UP_FILTER,
-            self._SUBNET_FILTER,
-            self._SELECT_FIRST_REGION_FILTER,
-            self._PRIORITY_FILTER,
-            self._WEIGHTED_SHUFFLE_FILTER,
-            self._SELECT_FIRST_N_FILTER,
-        ]
+    _FILTER_CHAIN_WITH_SUBNET = (
+        _UP_FILTER,
+        _SUBNET_FILTER,
+        _SELECT_FIRST_REGION_FILTER,
+        _PRIORITY_FILTER,
+        _WEIGHTED_SHUFFLE_FILTER,
+        _SELECT_FIRST_N_FILTER,
+    )
 
-    @property
-    def _FILTER_CHAIN_WITH_REGION_AND_COUNTRY(self):
-        return [
-            self._UP_FILTER,
-            self._COUNTRY_FILTER,
-            self._REGION_FILTER,
-            self._SELECT_FIRST_REGION_FILTER,
-            self._PRIORITY_FILTER,
-            self._WEIGHTED_SHUFFLE_FILTER,
-            self._SELECT_FIRST_N_FILTER,
-        ]
+    _FILTER_CHAIN_WITH_REGION_AND_COUNTRY = (
+        _UP_FILTER,
+        _COUNTRY_FILTER,
+        _REGION_FILTER,
+        _SELECT_FIRST_REGION_FILTER,
+        _PRIORITY_FILTER,
+        _WEIGHTED_SHUFFLE_FILTER,
+        _SELECT_FIRST_N_FILTER,
+    )
 
-    @property
-    def _FILTER_CHAIN_WITH_REGION_AND_SUBNET(self):
-        return [
-            self._UP_FILTER,
-            self._SUBNET_FILTER,
-            self._REGION_FILTER,
-            self._SELECT_FIRST_REGION_FILTER,
-            self._PRIORITY_FILTER,
-            self._WEIGHTED_SHUFFLE_FILTER,
-            self._SELECT_FIRST_N_FILTER,
-        ]
+    _FILTER_CHAIN_WITH_REGION_AND_SUBNET = (
+        _UP_FILTER,
+        _SUBNET_FILTER,
+        _REGION_FILTER,
+        _SELECT_FIRST_REGION_FILTER,
+        _PRIORITY_FILTER,
+        _WEIGHTED_SHUFFLE_FILTER,
+        _SELECT_FIRST_N_FILTER,
+    )
 
-    @property
-    def _FILTER_CHAIN_WITH_COUNTRY_AND_SUBNET(self):
-        return [
-            self._UP_FILTER,
-            self._SUBNET_FILTER,
-            self._COUNTRY_FILTER,
-            self._SELECT_FIRST_REGION_FILTER,
-            self._PRIORITY_FILTER,
-            self._WEIGHTED_SHUFFLE_FILTER,
-            self._SELECT_FIRST_N_FILTER,
-        ]
+    _FILTER_CHAIN_WITH_COUNTRY_AND_SUBNET = (
+        _UP_FILTER,
+        _SUBNET_FILTER,
+        _COUNTRY_FILTER,
+        _SELECT_FIRST_REGION_FILTER,
+        _PRIORITY_FILTER,
+        _WEIGHTED_SHUFFLE_FILTER,
+        _SELECT_FIRST_N_FILTER,
+    )
 
-    @property
-    def _FILTER_CHAIN_WITH_REGION_AND_COUNTRY_AND_SUBNET(self):
-        return [
-            self._UP_FILTER,
-            self._SUBNET_FILTER,
-            self._COUNTRY_FILTER,
-            self._REGION_FILTER,
-            self._SELECT_FIRST_REGION_FILTER,
-            self._PRIORITY_FILTER,
-            self._WEIGHTED_SHUFFLE_FILTER,
-            self._SELECT_FIRST_N_FILTER,
-        ]
+    _FILTER_CHAIN_WITH_REGION_AND_COUNTRY_AND_SUBNET = (
+        _UP_FILTER,
+        _SUBNET_FILTER,
+        _COUNTRY_FILTER,
+        _REGION_FILTER,
+        _SELECT_FIRST_REGION_FILTER,
+        _PRIORITY_FILTER,
+        _WEIGHTED_SHUFFLE_FILTER,
+        _SELECT_FIRST_N_FILTER,
+    )
+
+    # (has_region, has_country, has_subnet) -> filter chain
+    _FILTER_CHAIN_LOOKUP = {
+        (True, True, True): _FILTER_CHAIN_WITH_REGION_AND_COUNTRY_AND_SUBNET,
+        (True, True, False): _FILTER_CHAIN_WITH_REGION_AND_COUNTRY,
+        (True, False, True): _FILTER_CHAIN_WITH_REGION_AND_SUBNET,
+        (False, True, True): _FILTER_CHAIN_WITH_COUNTRY_AND_SUBNET,
+        (True, False, False): _FILTER_CHAIN_WITH_REGION,
+        (False, True, False): _FILTER_CHAIN_WITH_COUNTRY,
+        (False, False, True): _FILTER_CHAIN_WITH_SUBNET,
+        (False, False, False): _BASIC_FILTER_CHAIN,
+    }
+
+    # The only valid chains are the ones above, anything else needs updating
+    _FILTER_CHAIN_FINGERPRINTS = frozenset(
+        _filter_chain_fingerprint(c) for c in _FILTER_CHAIN_LOOKUP.values()
+    )
 
     _REGION_TO_CONTINENT = {
         'AFRICA': 'AF',
@@ -474,6 +820,8 @@ class Ns1Provider(BaseProvider):
         'US-EAST': 'NA',
         'US-WEST': 'NA',
     }
+    # Continent codes NS1 regions map to, for quick membership checks
+    _CONTINENTS = frozenset(_REGION_TO_CONTINENT.values())
     _CONTINENT_TO_REGIONS = {
         'AF': ('AFRICA',),
         'EU': ('EUROPE',),
@@ -482,9 +830,16 @@ class Ns1Provider(BaseProvider):
 
     # Necessary for handling unsupported continents in _CONTINENT_TO_REGIONS
     _CONTINENT_TO_LIST_OF_COUNTRIES = {
-        'AS': set(geo_data['AS'].keys()),
-        'OC': set(geo_data['OC'].keys()),
-        'NA': set(geo_data['NA'].keys()),
+        'AS': frozenset(geo_data['AS'].keys()),
+        'OC': frozenset(geo_data['OC'].keys()),
+        'NA': frozenset(geo_data['NA'].keys()),
+    }
+
+    # Reverse of geo_data, country code -> continent code
+    _COUNTRY_TO_CONTINENT = {
+        country: continent
+        for continent, countries in geo_data.items()
+        for country in countries
     }
 
     def __init__(
@@ -498,6 +853,8 @@ class Ns1Provider(BaseProvider):
         shared_notifylist=False,
         use_http_monitors=False,
         default_healthcheck_http_version="HTTP/1.0",
+        fetch_workers=1,
+        apply_workers=1,
         *args,
         **kwargs,
     ):
@@ -506,7 +863,8 @@ class Ns1Provider(BaseProvider):
             '__init__: id=%s, api_key=***, retry_count=%d, '
             'monitor_regions=%s, parallelism=%s, client_config=%s, '
             'shared_notifylist=%s, use_http_monitors=%s, '
-            'default_healthcheck_http_version=%s',
+            'default_healthcheck_http_version=%s, fetch_workers=%d, '
+            'apply_workers=%d',
             id,
             retry_count,
             monitor_regions,
@@ -515,6 +873,8 @@ class Ns1Provider(BaseProvider):
             shared_notifylist,
             use_http_monitors,
             default_healthcheck_http_version,
+            fetch_workers,
+            apply_workers,
         )
         super().__init__(id, *args, **kwargs)
         self.monitor_regions = monitor_regions
@@ -522,64 +882,47 @@ class Ns1Provider(BaseProvider):
         self.use_http_monitors = use_http_monitors
         self.record_filters = dict()
         self._client = Ns1Client(
-            api_key, parallelism, retry_count, client_config
+            api_key,
+            parallelism,
+            retry_count,
+            client_config,
+            fetch_workers,
+            apply_workers,
         )
         self.default_healthcheck_http_version = default_healthcheck_http_version
+        self._notifylists_lock = Lock()
+        # change class name -> (bound) method that applies it
+        self._apply_for = {
+            'Create': self._apply_Create,
+            'Delete': self._apply_Delete,
+            'Update': self._apply_Update,
+        }
 
     def _sanitize_disabled_in_filter_config(self, filter_cfg):
-        # remove disabled=False from filters
-        for filter in filter_cfg:
-            if 'disabled' in filter and filter['disabled'] is False:
-                del filter['disabled']
-        return filter_cfg
+        # copy of filter_cfg without any disabled=False
+        return [
+            {
+                k: v
+                for k, v in filter.items()
+                if k != 'disabled' or v is not False
+            }
+            for filter in filter_cfg
+        ]
 
     def _valid_filter_config(self, filter_cfg):
-        self._sanitize_disabled_in_filter_config(filter_cfg)
-        has_region = self._REGION_FILTER in filter_cfg
-        has_country = self._COUNTRY_FILTER in filter_cfg
-        has_subnet = self._SUBNET_FILTER in filter_cfg
-        expected_filter_cfg = self._get_updated_filter_chain(
-            has_region, has_country, has_subnet
+        filter_cfg = self._sanitize_disabled_in_filter_config(filter_cfg)
+        return (
+            _filter_chain_fingerprint(filter_cfg)
+            in self._FILTER_CHAIN_FINGERPRINTS
         )
-        return filter_cfg == expected_filter_cfg
 
     def _get_updated_filter_chain(self, has_region, has_country, has_subnet):
-        if has_region and has_country and has_subnet:
-            filter_chain = self._FILTER_CHAIN_WITH_REGION_AND_COUNTRY_AND_SUBNET
-        elif has_region and has_country:
-            filter_chain = self._FILTER_CHAIN_WITH_REGION_AND_COUNTRY
-        elif has_region and has_subnet:
-            filter_chain = self._FILTER_CHAIN_WITH_REGION_AND_SUBNET
-        elif has_country and has_subnet:
-            filter_chain = self._FILTER_CHAIN_WITH_COUNTRY_AND_SUBNET
-        elif has_region:
-            filter_chain = self._FILTER_CHAIN_WITH_REGION
-        elif has_country:
-            filter_chain = self._FILTER_CHAIN_WITH_COUNTRY
-        elif has_subnet:
-            filter_chain = self._FILTER_CHAIN_WITH_SUBNET
-        else:
-            filter_chain = self._BASIC_FILTER_CHAIN
-
-        return filter_chain
+        return self._FILTER_CHAIN_LOOKUP[(has_region, has_country, has_subnet)]
 
     def _encode_notes(self, data):
-        return ' '.join([f'{k}:{v}' for k, v in sorted(data.items())])
-
-    def _parse_notes(self, note):
-        data = {}
-        if note:
-            for piece in note.split(' '):
-                try:
-                    k, v = piece.split(':', 1)
-                except ValueError:
-                    continue
-                try:
-                    v = int(v)
-                except ValueError:
-                    pass
-                data[k] = v if v != '' else None
-        return data
+        return _encode_note_items(tuple(sorted(data.items())))
+
+    _parse_notes = staticmethod(_parse_notes)
 
     def _data_for_geo_A(self, _type, record):
         # record meta (which would include geo information is only
@@ -637,10 +980,15 @@ class Ns1Provider(BaseProvider):
 
         # Fill out the pools by walking the answers and looking at their
         # region (< v0.9.11) or notes (> v0.9.11).
-        pools = defaultdict(lambda: {'fallback': None, 'values': []})
+        pools = {}
+        # (pool_name, value, weight, status) of the values we've added
+        seen = set()
+        # this runs for every answer, avoid the attribute lookups in the loop
+        parse_notes = self._parse_notes
+        parse_pool_name = self._parse_dynamic_pool_name
         for answer in answers:
             meta = answer['meta']
-            notes = self._parse_notes(meta.get('note', ''))
+            notes = parse_notes(meta.get('note', ''))
 
             value = str(answer['answer'][0])
             if notes.get('from', False) == '--default--':
@@ -659,18 +1007,28 @@ class Ns1Provider(BaseProvider):
                     # Ignore all but priority 1
                     continue
                 # And use region's name as the pool name
-                pool_name = self._parse_dynamic_pool_name(answer['region'])
+                pool_name = parse_pool_name(answer['region'])
             else:
                 # > v0.9.11, use the notes-based name and consider all values
                 pool_name = notes_pool_name
 
-            pool = pools[pool_name]
+            try:
+                pool = pools[pool_name]
+            except KeyError:
+                pool = pools[pool_name] = {'fallback': None, 'values': []}
             value_dict = {'value': value, 'weight': int(meta.get('weight', 1))}
             if isinstance(meta['up'], bool):
                 value_dict['status'] = 'up' if meta['up'] else 'down'
 
-            if value_dict not in pool['values']:
+            key = (
+                pool_name,
+                value,
+                value_dict['weight'],
+                value_dict.get('status'),
+            )
+            if key not in seen:
                 # If we haven't seen this value before add it to the pool
+                seen.add(key)
                 pool['values'].append(value_dict)
 
             # If there's a fallback recorded in the value for its pool go ahead
@@ -686,9 +1044,12 @@ class Ns1Provider(BaseProvider):
 
     def _parse_rule_geos(self, meta, notes):
         geos = set()
+        continent_countries = self._CONTINENT_TO_LIST_OF_COUNTRIES
+        country_to_continent = self._COUNTRY_TO_CONTINENT
 
+        region_to_continent = self._REGION_TO_CONTINENT
         for georegion in meta.get('georegion', []):
-            geos.add(self._REGION_TO_CONTINENT[georegion])
+            geos.add(region_to_continent[georegion])
 
         # Countries are easy enough to map, we just have to find their
         # continent
@@ -707,17 +1068,16 @@ class Ns1Provider(BaseProvider):
 
         special_continents = dict()
         for country in meta.get('country', []):
-            geo_code = GeoCodes.country_to_code(country)
-            con = GeoCodes.parse(geo_code)['continent_code']
+            con = country_to_continent[country]
 
-            if con in self._CONTINENT_TO_LIST_OF_COUNTRIES:
+            if con in continent_countries:
                 special_continents.setdefault(con, set()).add(country)
             else:
-                geos.add(geo_code)
+                geos.add(f'{con}-{country}')
 
         for continent, countries in special_continents.items():
             if (
-                countries == self._CONTINENT_TO_LIST_OF_COUNTRIES[continent]
+                countries == continent_countries[continent]
                 or continent in continents_from_notes
             ):
                 # All countries found or continent in notes, so add it to geos
@@ -743,18 +1103,25 @@ class Ns1Provider(BaseProvider):
         # that may eventually run into problems, but I don't have any use-cases
         # examples currently where it would
         rules = {}
+        rule_geos = {}
+        parse_notes = self._parse_notes
+        parse_pool_name = self._parse_dynamic_pool_name
+        parse_rule_geos = self._parse_rule_geos
         for pool_name, region in sorted(regions.items()):
             # Get the actual pool name by removing the type
-            pool_name = self._parse_dynamic_pool_name(pool_name)
+            pool_name = parse_pool_name(pool_name)
 
             meta = region['meta']
-            notes = self._parse_notes(meta.get('note', ''))
+            notes = parse_notes(meta.get('note', ''))
 
             # The group notes field in the UI is a `note` on the region here,
             # that's where we can find our pool's fallback in < v0.9.11 anyway
             if 'fallback' in notes:
                 # set the fallback pool name
-                pools[pool_name]['fallback'] = notes['fallback']
+                pool = pools.setdefault(
+                    pool_name, {'fallback': None, 'values': []}
+                )
+                pool['fallback'] = notes['fallback']
 
             rule_order = notes['rule-order']
             try:
@@ -763,15 +1130,19 @@ class Ns1Provider(BaseProvider):
                 rule = {'pool': pool_name, '_order': rule_order}
                 rules[rule_order] = rule
 
-            geos = self._parse_rule_geos(meta, notes)
+            geos = parse_rule_geos(meta, notes)
             if geos:
                 # There are geos, combine them with any existing geos for this
-                # pool and recorded the sorted unique set of them
-                rule['geos'] = sorted(set(rule.get('geos', [])) | geos)
+                # pool, they'll be sorted once we've seen all the regions
+                rule_geos.setdefault(rule_order, set()).update(geos)
             subnets = set(meta.get('ip_prefixes', []))
             if subnets:
                 rule['subnets'] = sorted(subnets)
 
+        # Record the sorted unique set of each rule's geos
+        for rule_order, geos in rule_geos.items():
+            rules[rule_order]['geos'] = sorted(geos)
+
         # Convert to list and order
         rules = sorted(rules.values(), key=lambda r: (r['_order'], r['pool']))
 
@@ -862,31 +1233,51 @@ class Ns1Provider(BaseProvider):
     _data_for_ALIAS = _data_for_CNAME
     _data_for_DNAME = _data_for_CNAME
 
-    def _data_for_MX(self, _type, record):
-        values = []
-        for answer in record['short_answers']:
-            preference, exchange = answer.split(' ', 1)
-            values.append({'preference': preference, 'exchange': exchange})
-        return {'ttl': record['ttl'], 'type': _type, 'values': values}
+    # The short answers of these types are their fields, in order, space
+    # separated with the last field getting whatever's left over
+    _SPLIT_ANSWER_FIELDS = {
+        'DS': ('key_tag', 'algorithm', 'digest_type', 'digest'),
+        'MX': ('preference', 'exchange'),
+        'NAPTR': (
+            'order',
+            'preference',
+            'flags',
+            'service',
+            'regexp',
+            'replacement',
+        ),
+        'SRV': ('priority', 'weight', 'port', 'target'),
+        'TLSA': (
+            'certificate_usage',
+            'selector',
+            'matching_type',
+            'certificate_association_data',
+        ),
+        'URLFWD': ('path', 'target', 'code', 'masking', 'query'),
+    }
 
-    def _data_for_NAPTR(self, _type, record):
+    def _data_for_split_answers(self, _type, record):
+        fields = self._SPLIT_ANSWER_FIELDS[_type]
+        n = len(fields)
         values = []
         for answer in record['short_answers']:
-            (order, preference, flags, service, regexp, replacement) = (
-                answer.split(' ', 5)
-            )
-            values.append(
-                {
-                    'flags': flags,
-                    'order': order,
-                    'preference': preference,
-                    'regexp': regexp,
-                    'replacement': replacement,
-                    'service': service,
-                }
-            )
+            parts = answer.split(' ', n - 1)
+            # zip would quietly drop the missing fields
+            if len(parts) != n:
+                raise ValueError(
+                    f'{_type} answer "{answer}" has {len(parts)} fields, '
+                    f'expected {n}'
+                )
+            values.append(dict(zip(fields, parts)))
         return {'ttl': record['ttl'], 'type': _type, 'values': values}
 
+    _data_for_DS = _data_for_split_answers
+    _data_for_MX = _data_for_split_answers
+    _data_for_NAPTR = _data_for_split_answers
+    _data_for_SRV = _data_for_split_answers
+    _data_for_TLSA = _data_for_split_answers
+    _data_for_URLFWD = _data_for_split_answers
+
     def _data_for_NS(self, _type, record):
         return {
             'ttl': record['ttl'],
@@ -896,70 +1287,28 @@ class Ns1Provider(BaseProvider):
 
     _data_for_PTR = _data_for_NS
 
-    def _data_for_SRV(self, _type, record):
-        values = []
-        for answer in record['short_answers']:
-            priority, weight, port, target = answer.split(' ', 3)
-            values.append(
-                {
-                    'priority': priority,
-                    'weight': weight,
-                    'port': port,
-                    'target': target,
-                }
-            )
-        return {'ttl': record['ttl'], 'type': _type, 'values': values}
-
-    def _data_for_URLFWD(self, _type, record):
-        values = []
-        for answer in record['short_answers']:
-            path, target, code, masking, query = answer.split(' ', 4)
-            values.append(
-                {
-                    'path': path,
-                    'target': target,
-                    'code': code,
-                    'masking': masking,
-                    'query': query,
-                }
-            )
-        return {'ttl': record['ttl'], 'type': _type, 'values': values}
-
-    def _data_for_DS(self, _type, record):
-        values = []
-        for answer in record['short_answers']:
-            key_tag, algorithm, digest_type, digest = answer.split(' ', 3)
-            values.append(
-                {
-                    'key_tag': key_tag,
-                    'algorithm': algorithm,
-                    'digest_type': digest_type,
-                    'digest': digest,
-                }
-            )
-        return {'ttl': record['ttl'], 'type': _type, 'values': values}
-
-    def _data_for_TLSA(self, _type, record):
-        values = []
-        for answer in record['short_answers']:
-            (
-                certificate_usage,
-                selector,
-                matching_type,
-                certificate_association_data,
-            ) = answer.split(' ', 3)
-            values.append(
-                {
-                    'certificate_usage': certificate_usage,
-                    'selector': selector,
-                    'matching_type': matching_type,
-                    'certificate_association_data': certificate_association_data,
-                }
-            )
-        return {'ttl': record['ttl'], 'type': _type, 'values': values}
+    # record type -> unbound _data_for_* method, avoids a getattr per record
+    _DATA_FOR = {
+        'A': _data_for_A,
+        'AAAA': _data_for_AAAA,
+        'ALIAS': _data_for_ALIAS,
+        'CAA': _data_for_CAA,
+        'CNAME': _data_for_CNAME,
+        'DNAME': _data_for_DNAME,
+        'DS': _data_for_DS,
+        'MX': _data_for_MX,
+        'NAPTR': _data_for_NAPTR,
+        'NS': _data_for_NS,
+        'PTR': _data_for_PTR,
+        'SPF': _data_for_SPF,
+        'SRV': _data_for_SRV,
+        'TLSA': _data_for_TLSA,
+        'TXT': _data_for_TXT,
+        'URLFWD': _data_for_URLFWD,
+    }
 
     def list_zones(self):
-        return sorted([f'{z["zone"]}.' for z in self._client.zones_list()])
+        return sorted(f'{z["zone"]}.' for z in self._client.zones_list())
 
     def populate(self, zone, target=False, lenient=False):
         self.log.debug(
@@ -993,13 +1342,14 @@ class Ns1Provider(BaseProvider):
 
                 if record.get('tier', 1) > 1:
                     # Need to get the full record data for geo records
-                    record = self._client.records_retrieve(
-                        ns1_zone_name, record['domain'], record['type']
-                    )
-                    geo_records.append(record)
+                    geo_records.append((record['domain'], record['type']))
                 else:
                     records.append(record)
 
+            geo_records = self._client.records_retrieve_many(
+                ns1_zone_name, geo_records
+            )
+
             exists = True
         except ResourceException as e:
             if e.message != self.ZONE_NOT_FOUND_MESSAGE:
@@ -1008,20 +1358,29 @@ class Ns1Provider(BaseProvider):
             geo_records = []
             exists = False
 
+        if not records and not geo_records:
+            # nothing to convert, e.g. the zone doesn't exist (yet)
+            self.log.info('populate:   found 0 records, exists=%s', exists)
+            return exists
+
         before = len(zone.records)
         # geo information isn't returned from the main endpoint, so we need
         # to query for all records with geo information
         zone_hash = {}
+        data_fors = self._DATA_FOR
         for record in chain(records, geo_records):
             _type = record['type']
-            if _type not in self.SUPPORTS:
+            try:
+                data_for = data_fors[_type]
+            except KeyError:
+                # unsupported type
                 continue
-            data_for = getattr(self, f'_data_for_{_type}')
             name = zone.hostname_from_fqdn(record['domain'])
-            data = data_for(_type, record)
+            data = data_for(self, _type, record)
             record = Record.new(zone, name, data, source=self, lenient=lenient)
             zone_hash[(_type, name)] = record
-        [zone.add_record(r, lenient=lenient) for r in zone_hash.values()]
+        for record in zone_hash.values():
+            zone.add_record(record, lenient=lenient)
         self.log.info(
             'populate:   found %s records, exists=%s',
             len(zone.records) - before,
@@ -1041,10 +1400,7 @@ class Ns1Provider(BaseProvider):
                 # validate supported geos
                 for rule in record.dynamic.rules:
                     for geo in rule.data.get('geos', []):
-                        if (
-                            len(geo) == 2
-                            and geo not in self._REGION_TO_CONTINENT.values()
-                        ):
+                        if len(geo) == 2 and geo not in self._CONTINENTS:
                             msg = f'unsupported continent code {geo} in {record.fqdn}'
                             # no workable fallbacks so straight error
                             raise SupportsException(f'{self.id}: {msg}')
@@ -1063,7 +1419,7 @@ class Ns1Provider(BaseProvider):
         for iso_region, target in record.geo.items():
             key = 'iso_region_code'
             value = iso_region
-            if not has_country and len(value.split('-')) > 1:
+            if not has_country and '-' in value:
                 has_country = True
             for answer in target.values:
                 params['answers'].append(
@@ -1089,24 +1445,18 @@ class Ns1Provider(BaseProvider):
             expected_host = record.fqdn[:-1]
             expected_type = record._type
 
-            for monitor in self._client.monitors.values():
-                data = self._parse_notes(monitor['notes'])
-                if not data:
-                    continue
-                if (
-                    expected_host == data['host']
-                    and expected_type == data['type']
-                ):
-                    # This monitor belongs to this record
-                    value = data.get('value')
-                    if not value:
-                        # old style notes in TCP monitors
-                        value = monitor['config']['host']
-                    if record._type == 'CNAME':
-                        # Append a trailing dot for CNAME records so that
-                        # lookup by a CNAME answer works
-                        value = value + '.'
-                    monitors[value] = monitor
+            index = self._client.monitors_by_host_type
+            for monitor in index.get((expected_host, expected_type), ()):
+                # This monitor belongs to this record
+                value = self._parse_notes(monitor['notes']).get('value')
+                if not value:
+                    # old style notes in TCP monitors
+                    value = monitor['config']['host']
+                if record._type == 'CNAME':
+                    # Append a trailing dot for CNAME records so that
+                    # lookup by a CNAME answer works
+                    value = value + '.'
+                monitors[value] = monitor
 
         return monitors
 
@@ -1130,6 +1480,12 @@ class Ns1Provider(BaseProvider):
 
     def _notifylists_find_or_create(self, name):
         self.log.debug('_notifylists_find_or_create: name="%s"', name)
+        # the shared list is found or created by every monitor, make sure
+        # concurrent applies don't end up creating more than one of it
+        with self._notifylists_lock:
+            return self._notifylists_find_or_create_locked(name)
+
+    def _notifylists_find_or_create_locked(self, name):
         try:
             nl = self._client.notifylists[name]
             self.log.debug(
@@ -1179,65 +1535,65 @@ class Ns1Provider(BaseProvider):
         self._client.monitors_delete(monitor_id)
 
         notify_list_id = monitor['notify_list']
-        for nl_name, nl in self._client.notifylists.items():
-            if nl['id'] == notify_list_id:
-                # We've found the that might need deleting
-                if nl['name'] != self.SHARED_NOTIFYLIST_NAME:
-                    # It's not shared so is safe to delete
-                    self._client.notifylists_delete(notify_list_id)
-                break
+        nl_name = self._client.notifylist_names.get(notify_list_id)
+        # It's only safe to delete if we know it and it's not shared
+        if nl_name is not None and nl_name != self.SHARED_NOTIFYLIST_NAME:
+            self._client.notifylists_delete(notify_list_id)
+
+    def _healthcheck_cfg(self, record):
+        return record._octodns.get('ns1', {}).get('healthcheck', {})
 
     def _healthcheck_policy(self, record):
-        return (
-            record._octodns.get('ns1', {})
-            .get('healthcheck', {})
-            .get('policy', 'quorum')
-        )
+        return self._healthcheck_cfg(record).get('policy', 'quorum')
 
     def _healthcheck_frequency(self, record):
-        return (
-            record._octodns.get('ns1', {})
-            .get('healthcheck', {})
-            .get('frequency', 60)
-        )
+        return self._healthcheck_cfg(record).get('frequency', 60)
 
     def _healthcheck_rapid_recheck(self, record):
-        return (
-            record._octodns.get('ns1', {})
-            .get('healthcheck', {})
-            .get('rapid_recheck', False)
-        )
+        return self._healthcheck_cfg(record).get('rapid_recheck', False)
 
     def _healthcheck_connect_timeout(self, record):
-        return (
-            record._octodns.get('ns1', {})
-            .get('healthcheck', {})
-            .get('connect_timeout', 2)
-        )
+        return self._healthcheck_cfg(record).get('connect_timeout', 2)
 
     def _healthcheck_response_timeout(self, record):
-        return (
-            record._octodns.get('ns1', {})
-            .get('healthcheck', {})
-            .get('response_timeout', 10)
-        )
+        return self._healthcheck_cfg(record).get('response_timeout', 10)
 
     def _healthcheck_http_version(self, record):
-        http_version = (
-            record._octodns.get("ns1", {})
-            .get("healthcheck", {})
-            .get("http_version", self.default_healthcheck_http_version)
+        http_version = self._healthcheck_cfg(record).get(
+            'http_version', self.default_healthcheck_http_version
         )
-        acceptable_http_versions = ("HTTP/1.0", "HTTP/1.1")
-        if http_version not in acceptable_http_versions:
+        if http_version not in _ACCEPTABLE_HTTP_VERSIONS:
             raise Ns1Exception(
-                f"unsupported http version found: {http_version!r}. Expected version in {acceptable_http_versions}"
+                f"unsupported http version found: {http_version!r}. Expected version in {_ACCEPTABLE_HTTP_VERSIONS}"
             )
         return http_version
 
-    def _monitor_gen(self, record, value):
-        host = record.fqdn[:-1]
-        _type = record._type
+    def _monitor_template(self, record):
+        # the parts of the record's monitors that don't depend on the value,
+        # for generating several of them with _monitor_gen
+        protocol = record.healthcheck_protocol
+        template = {
+            'host': record.fqdn[:-1],
+            'type': record._type,
+            'policy': self._healthcheck_policy(record),
+            'frequency': self._healthcheck_frequency(record),
+            'rapid_recheck': self._healthcheck_rapid_recheck(record),
+            'connect_timeout': self._healthcheck_connect_timeout(record),
+            'response_timeout': self._healthcheck_response_timeout(record),
+            'protocol': protocol,
+            'port': record.healthcheck_port,
+            'path': record.healthcheck_path,
+        }
+        if protocol not in ('ICMP', 'TCP') and not self.use_http_monitors:
+            # only the legacy HTTP-emulating TCP monitors send a request
+            template['http_version'] = self._healthcheck_http_version(record)
+        return template
+
+    def _monitor_gen(self, record, value, template=None):
+        if template is None:
+            template = self._monitor_template(record)
+        host = template['host']
+        _type = template['type']
 
         if _type == 'CNAME':
             # NS1 does not accept a host value with a trailing dot
@@ -1247,17 +1603,17 @@ class Ns1Provider(BaseProvider):
             'active': True,
             'name': f'{host} - {_type} - {value}',
             'notes': {'host': host, 'type': _type},
-            'policy': self._healthcheck_policy(record),
-            'frequency': self._healthcheck_frequency(record),
-            'rapid_recheck': self._healthcheck_rapid_recheck(record),
+            'policy': template['policy'],
+            'frequency': template['frequency'],
+            'rapid_recheck': template['rapid_recheck'],
             'region_scope': 'fixed',
             'regions': self.monitor_regions,
         }
 
-        connect_timeout = self._healthcheck_connect_timeout(record)
-        response_timeout = self._healthcheck_response_timeout(record)
+        connect_timeout = template['connect_timeout']
+        response_timeout = template['response_timeout']
 
-        healthcheck_protocol = record.healthcheck_protocol
+        healthcheck_protocol = template['protocol']
         if healthcheck_protocol == 'ICMP':
             ret['job_type'] = 'ping'
             ret['config'] = {
@@ -1271,7 +1627,7 @@ class Ns1Provider(BaseProvider):
             ret['job_type'] = 'tcp'
             ret['config'] = {
                 'host': value,
-                'port': record.healthcheck_port,
+                'port': template['port'],
                 # TCP monitors use milliseconds, so convert from seconds to milliseconds
                 'connect_timeout': connect_timeout * 1000,
                 'response_timeout': response_timeout * 1000,
@@ -1281,9 +1637,9 @@ class Ns1Provider(BaseProvider):
             if healthcheck_protocol != 'TCP':
                 # legacy HTTP-emulating TCP monitor
                 # we need to send the HTTP request string
-                path = record.healthcheck_path
+                path = template['path']
                 host = record.healthcheck_host(value=value)
-                http_version = self._healthcheck_http_version(record)
+                http_version = template['http_version']
                 request = (
                     fr'GET {path} {http_version}\r\nHost: {host}\r\n'
                     r'User-agent: NS1\r\n\r\n'
@@ -1302,8 +1658,8 @@ class Ns1Provider(BaseProvider):
             ret['job_type'] = 'http'
             proto = healthcheck_protocol.lower()
             domain = f'[{value}]' if _type == 'AAAA' else value
-            port = record.healthcheck_port
-            path = record.healthcheck_path
+            port = template['port']
+            path = template['path']
             ret['config'] = {
                 'url': f'{proto}://{domain}:{port}{path}',
                 'virtual_host': record.healthcheck_host(value=value),
@@ -1345,8 +1701,10 @@ class Ns1Provider(BaseProvider):
                         )
                         return False
             elif k == 'regions':
-                # regions can be out of order
-                if set(have.get(k, [])) != set(v):
+                # regions can be out of order, they usually aren't though so
+                # only build the sets when a straight comparison fails
+                have_regions = have.get(k, [])
+                if have_regions != v and set(have_regions) != set(v):
                     self.log.info(
                         f'{log_prefix}: got {k}={have.get(k)}, expected {v}'
                     )
@@ -1433,46 +1791,52 @@ class Ns1Provider(BaseProvider):
         while current_pool_name and current_pool_name not in seen:
             seen.add(current_pool_name)
             pool = pools[current_pool_name]
+            fallback = pool.data['fallback']
+            # the note is the same for every answer from this pool
+            note = self._encode_notes(
+                {
+                    'from': pool_label,
+                    'pool': current_pool_name,
+                    'fallback': fallback or '',
+                }
+            )
             for answer in pool_answers[current_pool_name]:
-                fallback = pool.data['fallback']
-                if answer['feed_id']:
-                    up = {'feed': answer['feed_id']}
-                else:
-                    up = answer['status'] == 'up'
-                answer = {
+                feed_id = answer.feed_id
+                answers.append(
+                    {
+                        'answer': answer.answer,
+                        'meta': {
+                            'priority': priority,
+                            'note': note,
+                            'up': (
+                                {'feed': feed_id}
+                                if feed_id
+                                else answer.status == 'up'
+                            ),
+                            'weight': answer.weight,
+                        },
+                        'region': pool_label,  # the one we're answering
+                    }
+                )
+
+            current_pool_name = fallback
+            priority += 1
+
+        # Static/default
+        note = self._encode_notes({'from': '--default--'})
+        for answer in default_answers:
+            answers.append(
+                {
                     'answer': answer['answer'],
                     'meta': {
                         'priority': priority,
-                        'note': self._encode_notes(
-                            {
-                                'from': pool_label,
-                                'pool': current_pool_name,
-                                'fallback': fallback or '',
-                            }
-                        ),
-                        'up': up,
-                        'weight': answer['weight'],
+                        'note': note,
+                        'up': True,
+                        'weight': 1,
                     },
                     'region': pool_label,  # the one we're answering
                 }
-                answers.append(answer)
-
-            current_pool_name = pool.data.get('fallback', None)
-            priority += 1
-
-        # Static/default
-        for answer in default_answers:
-            answer = {
-                'answer': answer['answer'],
-                'meta': {
-                    'priority': priority,
-                    'note': self._encode_notes({'from': '--default--'}),
-                    'up': True,
-                    'weight': 1,
-                },
-                'region': pool_label,  # the one we're answering
-            }
-            answers.append(answer)
+            )
 
     def _generate_regions(self, record):
         pools = record.dynamic.pools
@@ -1487,6 +1851,9 @@ class Ns1Provider(BaseProvider):
                 if len(geo) == 5:
                     con, country = geo.split('-', 1)
                     explicit_countries.setdefault(con, set()).add(country)
+        # continent -> its countries less the explicit ones, which only
+        # depends on the continent so it's shared by every rule using it
+        continent_countries = {}
 
         for i, rule in enumerate(record.dynamic.rules):
             pool_name = rule.data['pool']
@@ -1508,11 +1875,11 @@ class Ns1Provider(BaseProvider):
                 if n == 8:
                     # US state, e.g. NA-US-KY
                     # CA province, e.g. NA-CA-NL
-                    (
-                        us_state.add(geo[-2:])
-                        if "NA-US" in geo
-                        else ca_province.add(geo[-2:])
-                    )
+                    code = geo[-2:]
+                    if geo.startswith('NA-US'):
+                        us_state.add(code)
+                    else:
+                        ca_province.add(code)
                     # For filtering. State filtering is done by the country
                     # filter
                     has_country = True
@@ -1529,13 +1896,18 @@ class Ns1Provider(BaseProvider):
                         # No maps for geo in _CONTINENT_TO_REGIONS.
                         # Use the country list
                         self.log.debug(
-                            'Converting geo {} to country list'.format(geo)
-                        )
-                        continent_countries = (
-                            self._CONTINENT_TO_LIST_OF_COUNTRIES[geo]
+                            '_generate_regions: converting geo %s to country '
+                            'list',
+                            geo,
                         )
-                        exclude = explicit_countries.get(geo, set())
-                        country.update(continent_countries - exclude)
+                        try:
+                            countries = continent_countries[geo]
+                        except KeyError:
+                            countries = self._CONTINENT_TO_LIST_OF_COUNTRIES[
+                                geo
+                            ] - explicit_countries.get(geo, set())
+                            continent_countries[geo] = countries
+                        country.update(countries)
                         notes.setdefault('continents', set()).add(geo)
                         has_country = True
 
@@ -1545,12 +1917,12 @@ class Ns1Provider(BaseProvider):
             if subnet:
                 has_subnet = True
 
-            meta = {'note': self._encode_notes(notes)}
+            note = self._encode_notes(notes)
 
             if georegion:
-                georegion_meta = dict(meta)
-                georegion_meta['georegion'] = sorted(georegion)
-                regions[f'{pool_name}__georegion'] = {'meta': georegion_meta}
+                regions[f'{pool_name}__georegion'] = {
+                    'meta': {'note': note, 'georegion': sorted(georegion)}
+                }
 
             if country or us_state or ca_province:
                 # If there's country and/or states its a country pool,
@@ -1558,7 +1930,7 @@ class Ns1Provider(BaseProvider):
                 # same step in the filterchain (countries and georegions
                 # cannot as they're seperate stages and run the risk of
                 # eliminating all options)
-                country_state_meta = dict(meta)
+                country_state_meta = {'note': note}
                 if country:
                     country_state_meta['country'] = sorted(country)
                 if us_state:
@@ -1568,13 +1940,13 @@ class Ns1Provider(BaseProvider):
                 regions[f'{pool_name}__country'] = {'meta': country_state_meta}
 
             if subnet:
-                subnet_meta = dict(meta)
-                subnet_meta['ip_prefixes'] = sorted(subnet)
-                regions[f'{pool_name}__subnet'] = {'meta': subnet_meta}
+                regions[f'{pool_name}__subnet'] = {
+                    'meta': {'note': note, 'ip_prefixes': sorted(subnet)}
+                }
 
             if not (subnet or country or us_state or ca_province or georegion):
                 # If there's no targeting it's a catchall
-                regions[f'{pool_name}__catchall'] = {'meta': meta}
+                regions[f'{pool_name}__catchall'] = {'meta': {'note': note}}
 
         return has_subnet, has_country, has_region, regions
 
@@ -1595,11 +1967,11 @@ class Ns1Provider(BaseProvider):
 
                 feed_id = None
                 if status == 'obey':
-                    # state is not forced, let's find a monitor
-                    feed_id = value_feed.get(value)
-                    # check for identical monitor and skip creating one if
-                    # found
-                    if not feed_id:
+                    # state is not forced, let's find a monitor, each value
+                    # is only synced once no matter how many pools it's in
+                    try:
+                        feed_id = value_feed[value]
+                    except KeyError:
                         existing = existing_monitors.get(value)
                         monitor_id, feed_id = self._monitor_sync(
                             record, value, existing
@@ -1608,12 +1980,7 @@ class Ns1Provider(BaseProvider):
                         active_monitors.add(monitor_id)
 
                 pool_answers[pool_name].append(
-                    {
-                        'answer': [value],
-                        'weight': weight,
-                        'feed_id': feed_id,
-                        'status': status,
-                    }
+                    _PoolAnswer([value], weight, feed_id, status)
                 )
 
         if record._type == 'CNAME':
@@ -1659,7 +2026,7 @@ class Ns1Provider(BaseProvider):
 
         return {
             'answers': answers,
-            'filters': filters,
+            'filters': _thaw_filter_chain(filters),
             'regions': regions,
             'ttl': record.ttl,
         }, active_monitors
@@ -1689,10 +2056,22 @@ class Ns1Provider(BaseProvider):
 
     _params_for_TXT = _params_for_SPF
 
-    def _params_for_CAA(self, record):
-        values = [(v.flags, v.tag, v.value) for v in record.values]
+    # record type -> getter for the answer tuple of one of its values, the
+    # fields are in the same order as they are in NS1's (short) answers
+    _ANSWER_GETTERS = dict(
+        (
+            (t, attrgetter(*fields))
+            for t, fields in _SPLIT_ANSWER_FIELDS.items()
+        ),
+        CAA=attrgetter('flags', 'tag', 'value'),
+    )
+
+    def _params_for_answer_tuples(self, record):
+        values = list(map(self._ANSWER_GETTERS[record._type], record.values))
         return {'answers': values, 'ttl': record.ttl}, None
 
+    _params_for_CAA = _params_for_answer_tuples
+
     def _params_for_CNAME(self, record):
         if getattr(record, 'dynamic', False):
             return self._params_for_dynamic(record)
@@ -1707,55 +2086,49 @@ class Ns1Provider(BaseProvider):
     _params_for_ALIAS = _params_for_CNAME
     _params_for_DNAME = _params_for_CNAME
 
-    def _params_for_MX(self, record):
-        values = [(v.preference, v.exchange) for v in record.values]
-        return {'answers': values, 'ttl': record.ttl}, None
-
-    def _params_for_NAPTR(self, record):
-        values = [
-            (v.order, v.preference, v.flags, v.service, v.regexp, v.replacement)
-            for v in record.values
-        ]
-        return {'answers': values, 'ttl': record.ttl}, None
+    _params_for_MX = _params_for_answer_tuples
+    _params_for_NAPTR = _params_for_answer_tuples
 
     def _params_for_PTR(self, record):
         return {'answers': record.values, 'ttl': record.ttl}, None
 
-    def _params_for_SRV(self, record):
-        values = [
-            (v.priority, v.weight, v.port, v.target) for v in record.values
-        ]
-        return {'answers': values, 'ttl': record.ttl}, None
-
-    def _params_for_URLFWD(self, record):
-        values = [
-            (v.path, v.target, v.code, v.masking, v.query)
-            for v in record.values
-        ]
-        return {'answers': values, 'ttl': record.ttl}, None
-
-    def _params_for_DS(self, record):
-        values = [
-            (v.key_tag, v.algorithm, v.digest_type, v.digest)
-            for v in record.values
-        ]
-        return {'answers': values, 'ttl': record.ttl}, None
-
-    def _params_for_TLSA(self, record):
-        values = [
-            (
-                v.certificate_usage,
-                v.selector,
-                v.matching_type,
-                v.certificate_association_data,
-            )
-            for v in record.values
-        ]
-        return {'answers': values, 'ttl': record.ttl}, None
+    _params_for_DS = _params_for_answer_tuples
+    _params_for_SRV = _params_for_answer_tuples
+    _params_for_TLSA = _params_for_answer_tuples
+    _params_for_URLFWD = _params_for_answer_tuples
+
+    # record type -> unbound _params_for_* method, avoids a getattr per record
+    _PARAMS_FOR = {
+        'A': _params_for_A,
+        'AAAA': _params_for_AAAA,
+        'ALIAS': _params_for_ALIAS,
+        'CAA': _params_for_CAA,
+        'CNAME': _params_for_CNAME,
+        'DNAME': _params_for_DNAME,
+        'DS': _params_for_DS,
+        'MX': _params_for_MX,
+        'NAPTR': _params_for_NAPTR,
+        'NS': _params_for_NS,
+        'PTR': _params_for_PTR,
+        'SPF': _params_for_SPF,
+        'SRV': _params_for_SRV,
+        'TLSA': _params_for_TLSA,
+        'TXT': _params_for_TXT,
+        'URLFWD': _params_for_URLFWD,
+    }
 
     def _extra_changes(self, desired, changes, **kwargs):
         self.log.debug('_extra_changes: desired=%s', desired.name)
-        changed = set([c.record for c in changes])
+        # Records are equal when their name & type are, key on those directly
+        # rather than hashing (formatting) each Record
+        changed = {(c.record.name, c.record._type) for c in changes}
+        # hoisted, these are hit for every dynamic record/value
+        record_filters = self.record_filters
+        valid_filter_config = self._valid_filter_config
+        monitors_for = self._monitors_for
+        monitor_template = self._monitor_template
+        monitor_gen = self._monitor_gen
+        monitor_is_match = self._monitor_is_match
         extra = []
         for record in desired.records:
             if not getattr(record, 'dynamic', False):
@@ -1770,8 +2143,10 @@ class Ns1Provider(BaseProvider):
             # config at all. Filters however might still need an update
             domain = record.fqdn[:-1]
             _type = record._type
-            record_filters = self.record_filters.get(domain, {}).get(_type, [])
-            if not self._valid_filter_config(record_filters):
+            filters = record_filters.get(domain, _NO_RECORD_FILTERS).get(
+                _type, ()
+            )
+            if not valid_filter_config(filters):
                 # unrecognized set of filters, overwrite them by updating the
                 # record
                 self.log.info(
@@ -1782,61 +2157,65 @@ class Ns1Provider(BaseProvider):
                 update = True
 
             # check if any monitor needs to be synced
-            existing = self._monitors_for(record)
-            for pool in record.dynamic.pools.values():
-                for val in pool.data['values']:
-                    if val['status'] != 'obey':
-                        # no monitor necessary
-                        continue
-
-                    value = val['value']
-                    expected = self._monitor_gen(record, value)
-                    name = expected['name']
-
-                    have = existing.get(value)
-                    if not have:
-                        if self.use_http_monitors:
-                            self.log.warning(
-                                '_extra_changes: missing monitor "%s" will be created of type http, '
-                                'octodns-ns1 cannot be downgraded below v0.0.5 after applying this change',
-                                name,
-                            )
-                        else:
-                            self.log.info(
-                                '_extra_changes: missing monitor %s', name
-                            )
-                        update = True
-                        continue
-
-                    if not self._monitor_is_match(expected, have):
-                        if expected['job_type'] == have['job_type']:
-                            self.log.info(
-                                '_extra_changes: monitor mis-match for %s', name
-                            )
-                        else:
-                            # NS1 monitor job types cannot be changed, so we need to do
-                            # delete+create, which has a few implications:
-                            self.log.warning(
-                                '_extra_changes: existing %s monitor "%s" will be deleted and replaced by a new %s monitor, '
-                                '`%s` will be temporarily treated as being healthy as a result, '
-                                'this is operation will be irreversible and not forward-compatible, ie '
-                                'octodns-ns1 cannot be downgraded below v0.0.5 after applying this change',
-                                have['job_type'],
-                                name,
-                                expected['job_type'],
-                                value,
-                            )
-                        update = True
-
-                    if not have.get('notify_list'):
+            existing = monitors_for(record)
+            # values that aren't obey don't need a monitor
+            values = [
+                val['value']
+                for pool in record.dynamic.pools.values()
+                for val in pool.data['values']
+                if val['status'] == 'obey'
+            ]
+            if values:
+                # the record level bits are the same for all of its monitors
+                template = monitor_template(record)
+            for value in values:
+                expected = monitor_gen(record, value, template)
+                name = expected['name']
+
+                have = existing.get(value)
+                if not have:
+                    if self.use_http_monitors:
+                        self.log.warning(
+                            '_extra_changes: missing monitor "%s" will be created of type http, '
+                            'octodns-ns1 cannot be downgraded below v0.0.5 after applying this change',
+                            name,
+                        )
+                    else:
                         self.log.info(
-                            '_extra_changes: broken monitor no notify list %s (%s)',
+                            '_extra_changes: missing monitor %s', name
+                        )
+                    update = True
+                    continue
+
+                if not monitor_is_match(expected, have):
+                    if expected['job_type'] == have['job_type']:
+                        self.log.info(
+                            '_extra_changes: monitor mis-match for %s', name
+                        )
+                    else:
+                        # NS1 monitor job types cannot be changed, so we need to do
+                        # delete+create, which has a few implications:
+                        self.log.warning(
+                            '_extra_changes: existing %s monitor "%s" will be deleted and replaced by a new %s monitor, '
+                            '`%s` will be temporarily treated as being healthy as a result, '
+                            'this is operation will be irreversible and not forward-compatible, ie '
+                            'octodns-ns1 cannot be downgraded below v0.0.5 after applying this change',
+                            have['job_type'],
                             name,
-                            have['id'],
+                            expected['job_type'],
+                            value,
                         )
-                        update = True
+                    update = True
+
+                if not have.get('notify_list'):
+                    self.log.info(
+                        '_extra_changes: broken monitor no notify list %s (%s)',
+                        name,
+                        have['id'],
+                    )
+                    update = True
 
-            if update and record not in changed:
+            if update and (record.name, record._type) not in changed:
                 extra.append(Update(record, record))
 
         return extra
@@ -1848,15 +2227,18 @@ class Ns1Provider(BaseProvider):
         This means our desired NS records must be applied as an Update, rather than a Create.
         '''
         for i, change in enumerate(changes):
+            # cheapest checks first, there's only ever one root NS record so
+            # we're done once we've found it
             if (
-                change.record.name == ''
+                isinstance(change, Create)
                 and change.record._type == 'NS'
-                and isinstance(change, Create)
+                and change.record.name == ''
             ):
                 self.log.info(
                     '_force_root_ns_update: found root NS record creation, changing to update'
                 )
                 changes[i] = Update(None, change.record)
+                break
         return changes
 
     def _apply_Create(self, ns1_zone, change):
@@ -1864,7 +2246,7 @@ class Ns1Provider(BaseProvider):
         zone = new.zone.name[:-1]
         domain = new.fqdn[:-1]
         _type = new._type
-        params, active_monitor_ids = getattr(self, f'_params_for_{_type}')(new)
+        params, active_monitor_ids = self._PARAMS_FOR[_type](self, new)
         self._client.records_create(zone, domain, _type, **params)
         self._monitors_gc(new, active_monitor_ids)
 
@@ -1873,7 +2255,7 @@ class Ns1Provider(BaseProvider):
         zone = new.zone.name[:-1]
         domain = new.fqdn[:-1]
         _type = new._type
-        params, active_monitor_ids = getattr(self, f'_params_for_{_type}')(new)
+        params, active_monitor_ids = self._PARAMS_FOR[_type](self, new)
         self._client.records_update(zone, domain, _type, **params)
         # It's possible change.existing is None because in the case of zone creation, we swap out the NS record Create for an Update, but we don't set the existing
         # record (see _force_root_ns_update).
@@ -1891,11 +2273,7 @@ class Ns1Provider(BaseProvider):
         self._monitors_gc(existing)
 
     def _has_dynamic(self, changes):
-        for change in changes:
-            if getattr(change.record, 'dynamic', False):
-                return True
-
-        return False
+        return any(getattr(c.record, 'dynamic', False) for c in changes)
 
     def _apply(self, plan):
         desired = plan.desired
@@ -1920,6 +2298,54 @@ class Ns1Provider(BaseProvider):
             ns1_zone = self._client.zones_create(domain_name)
             changes = self._force_root_ns_update(changes)
 
+        apply_for = self._apply_for
+        workers = min(self._client.apply_workers, len(changes))
+        if workers < 2:
+            for change in changes:
+                apply_for[change.__class__.__name__](ns1_zone, change)
+            return
+
+        # Root NS updates and deletes go first, one at a time, so that e.g. a
+        # Delete of an A and the Create of a CNAME with the same name can't
+        # race. Creates and then updates, which are for distinct records, can
+        # go out concurrently, each phase finishing before the next starts so
+        # that a failure stops everything after it.
+        first, creates, updates = [], [], []
         for change in changes:
-            class_name = change.__class__.__name__
-            getattr(self, f'_apply_{class_name}')(ns1_zone, change)
+            record = change.record
+            if isinstance(change, Delete) or (
+                isinstance(change, Update)
+                and record._type == 'NS'
+                and record.name == ''
+            ):
+                first.append(change)
+            elif isinstance(change, Create):
+                creates.append(change)
+            else:
+                updates.append(change)
+        # root NS updates ahead of the deletes
+        first.sort(key=lambda c: isinstance(c, Delete))
+
+        for change in first:
+            apply_for[change.__class__.__name__](ns1_zone, change)
+
+        # Build the shared, lazily loaded, bits up front so that the workers
+        # don't race to fetch (or create) them.
+        if self._has_dynamic(creates) or self._has_dynamic(updates):
+            self._client.datasource_id
+            self._client.feeds_for_monitors
+            self._client.monitors_for_feeds
+            self._client.monitors_by_host_type
+            self._client.notifylist_names
+        self.log.debug('_apply:   applying with %d workers', workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for phase in (creates, updates):
+                futures = [
+                    executor.submit(
+                        apply_for[change.__class__.__name__], ns1_zone, change
+                    )
+                    for change in phase
+                ]
+                # wait for the phase & surface any failures
+                for future in futures:
+                    future.result()
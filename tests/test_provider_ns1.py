@@ -2,7 +2,7 @@
 #
 #
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from unittest import TestCase
 from unittest.mock import call, patch
 
@@ -10,10 +10,10 @@ from ns1.rest.errors import AuthException, RateLimitException, ResourceException
 
 from octodns.provider import SupportsException
 from octodns.provider.plan import Plan
-from octodns.record import Delete, Record, Update
+from octodns.record import Create, Delete, Record, Update
 from octodns.zone import Zone
 
-from octodns_ns1 import Ns1Client, Ns1Exception, Ns1Provider
+from octodns_ns1 import Ns1Client, Ns1Exception, Ns1Provider, TokenBucket
 
 
 class TestNs1Provider(TestCase):
@@ -567,7 +567,7 @@ class TestNs1Provider(TestCase):
             'server error: zone not found', response=DummyResponse(), body='x'
         )
 
-        zone_create_mock.side_effect = ['foo']
+        zone_create_mock.side_effect = [{'records': []}]
         # Test out the create rate-limit handling, then successes for the rest
         record_create_mock.side_effect = [
             RateLimitException('boo', period=0)
@@ -691,9 +691,7 @@ class TestNs1Provider(TestCase):
         plan = provider.plan(desired)
         self.assertEqual(3, len(plan.changes))
         # Shouldn't rely on order so just count classes
-        classes = defaultdict(lambda: 0)
-        for change in plan.changes:
-            classes[change.__class__] += 1
+        classes = Counter(change.__class__ for change in plan.changes)
         self.assertEqual(1, classes[Delete])
         self.assertEqual(2, classes[Update])
 
@@ -789,6 +787,55 @@ class TestNs1Provider(TestCase):
         params, _ = provider._params_for_SPF(record)
         self.assertEqual(['foo; bar baz; blip'], params['answers'])
 
+    def test_dispatch_tables(self):
+        # every supported type has a handler in both directions
+        self.assertEqual(Ns1Provider.SUPPORTS, set(Ns1Provider._DATA_FOR))
+        self.assertEqual(Ns1Provider.SUPPORTS, set(Ns1Provider._PARAMS_FOR))
+        self.assertIs(
+            Ns1Provider._data_for_CNAME, Ns1Provider._DATA_FOR['ALIAS']
+        )
+        self.assertIs(Ns1Provider._params_for_A, Ns1Provider._PARAMS_FOR['NS'])
+        for _type in Ns1Provider._SPLIT_ANSWER_FIELDS:
+            self.assertIs(
+                Ns1Provider._data_for_split_answers,
+                Ns1Provider._DATA_FOR[_type],
+            )
+        for _type in Ns1Provider._ANSWER_GETTERS:
+            self.assertIs(
+                Ns1Provider._params_for_answer_tuples,
+                Ns1Provider._PARAMS_FOR[_type],
+            )
+
+    def test_data_for_split_answers(self):
+        provider = Ns1Provider('test', 'api-key')
+
+        # the last field gets whatever's left over
+        record = {'ttl': 42, 'short_answers': ['10 20 443 target.unit.tests.']}
+        self.assertEqual(
+            {
+                'ttl': 42,
+                'type': 'SRV',
+                'values': [
+                    {
+                        'priority': '10',
+                        'weight': '20',
+                        'port': '443',
+                        'target': 'target.unit.tests.',
+                    }
+                ],
+            },
+            provider._data_for_split_answers('SRV', record),
+        )
+
+        # missing fields aren't quietly dropped
+        record['short_answers'] = ['10 target.unit.tests.']
+        with self.assertRaises(ValueError) as ctx:
+            provider._data_for_split_answers('SRV', record)
+        self.assertEqual(
+            'SRV answer "10 target.unit.tests." has 2 fields, expected 4',
+            str(ctx.exception),
+        )
+
     def test_data_for_CNAME(self):
         provider = Ns1Provider('test', 'api-key')
 
@@ -938,6 +985,12 @@ class TestNs1ProviderDynamic(TestCase):
         notes = provider._encode_notes(data)
         self.assertEqual(data, provider._parse_notes(notes))
 
+        # Encoding is order independent and the results are shared
+        self.assertEqual('key:value priority:1', notes)
+        self.assertIs(
+            notes, provider._encode_notes({'priority': 1, 'key': 'value'})
+        )
+
         # integers come out as int
         self.assertEqual(
             {'rule-order': 1}, provider._parse_notes('rule-order:1')
@@ -954,6 +1007,19 @@ class TestNs1ProviderDynamic(TestCase):
             provider._parse_notes('rule-order:1-thing'),
         )
 
+        # values can contain :, pieces without one are ignored, empty values
+        # are None, and negative integers are ints
+        self.assertEqual(
+            {'a': 'b:c', 'd': None, 'e': -3},
+            provider._parse_notes('a:b:c  junk d: e:-3'),
+        )
+
+        # parsed notes are cached and shared so they're read-only
+        parsed = provider._parse_notes('pool:iad rule-order:2')
+        self.assertIs(parsed, provider._parse_notes('pool:iad rule-order:2'))
+        with self.assertRaises(TypeError):
+            parsed['pool'] = 'lax'
+
     def test_monitors_for(self):
         provider = Ns1Provider('test', 'api-key')
 
@@ -1015,6 +1081,8 @@ class TestNs1ProviderDynamic(TestCase):
 
         # Check for HTTP monitors match from notes
         provider._client._monitors_cache['eight'] = monitor_eight
+        # we went around the client so the index needs to be rebuilt
+        provider._client._monitors_by_host_type = None
         self.assertEqual(
             {'iad.unit.tests.': monitor_eight},
             provider._monitors_for(self.cname_record()),
@@ -1112,8 +1180,8 @@ class TestNs1ProviderDynamic(TestCase):
         try_mock.assert_called_once()
         # The shared notifylist should be cached now
         self.assertEqual(
-            [provider.SHARED_NOTIFYLIST_NAME],
-            list(provider._client._notifylists_cache.keys()),
+            {provider.SHARED_NOTIFYLIST_NAME},
+            provider._client._notifylists_cache.keys(),
         )
 
         # Second time we'll use the cached version
@@ -1245,7 +1313,9 @@ class TestNs1ProviderDynamic(TestCase):
         record = self.aaaa_record()
         monitor = provider._monitor_gen(record, value)
         self.assertTrue(monitor['config']['ipv6'])
-        self.assertTrue(f'[{value}]' in monitor['config']['url'])
+        self.assertEqual(
+            'http://[::ffff:3.4.5.6]:80/_ping', monitor['config']['url']
+        )
 
     def test_monitor_gen_CNAME_http(self):
         provider = Ns1Provider('test', 'api-key', use_http_monitors=True)
@@ -1253,7 +1323,10 @@ class TestNs1ProviderDynamic(TestCase):
         value = 'iad.unit.tests.'
         record = self.cname_record()
         monitor = provider._monitor_gen(record, value)
-        self.assertTrue(value[:-1] in monitor['config']['url'])
+        # no trailing dot
+        self.assertEqual(
+            'http://iad.unit.tests:80/_ping', monitor['config']['url']
+        )
 
     def test_monitor_gen_ICMP(self):
         provider = Ns1Provider('test', 'api-key', use_http_monitors=True)
@@ -1519,6 +1592,9 @@ class TestNs1ProviderDynamic(TestCase):
             monitors_delete_mock.reset_mock()
             monitors_for_mock.reset_mock()
             notifylists_delete_mock.reset_mock()
+            # the (mocked) deletes don't maintain the id index, rebuild it
+            # from whatever notify lists the next case seeds
+            provider._client._notifylist_names = None
 
         # No active monitors and no existing, nothing will happen
         reset()
@@ -1606,6 +1682,54 @@ class TestNs1ProviderDynamic(TestCase):
         monitors_delete_mock.assert_has_calls([call('mon-id2')])
         notifylists_delete_mock.assert_not_called()
 
+    def test_get_updated_filter_chain(self):
+        provider = Ns1Provider('test', 'api-key')
+
+        for flags, expected in (
+            ((False, False, False), provider._BASIC_FILTER_CHAIN),
+            ((True, False, False), provider._FILTER_CHAIN_WITH_REGION),
+            ((False, True, False), provider._FILTER_CHAIN_WITH_COUNTRY),
+            ((False, False, True), provider._FILTER_CHAIN_WITH_SUBNET),
+            (
+                (True, True, False),
+                provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY,
+            ),
+            (
+                (True, False, True),
+                provider._FILTER_CHAIN_WITH_REGION_AND_SUBNET,
+            ),
+            (
+                (False, True, True),
+                provider._FILTER_CHAIN_WITH_COUNTRY_AND_SUBNET,
+            ),
+            (
+                (True, True, True),
+                provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY_AND_SUBNET,
+            ),
+        ):
+            self.assertIs(expected, provider._get_updated_filter_chain(*flags))
+
+    def test_valid_filter_config(self):
+        provider = Ns1Provider('test', 'api-key')
+
+        # all of the canonical chains, in their API (plain dict) form, are
+        # valid
+        for chain in provider._FILTER_CHAIN_LOOKUP.values():
+            self.assertTrue(provider._valid_filter_config(list(chain)))
+            self.assertTrue(
+                provider._valid_filter_config([dict(f) for f in chain])
+            )
+
+        # no filters, missing, re-ordered, or modified filters are not
+        chain = [dict(f) for f in provider._BASIC_FILTER_CHAIN]
+        self.assertFalse(provider._valid_filter_config([]))
+        self.assertFalse(provider._valid_filter_config(chain[1:]))
+        self.assertFalse(provider._valid_filter_config(chain[::-1]))
+        chain[-1] = {'config': {'N': u'2'}, 'filter': u'select_first_n'}
+        self.assertFalse(provider._valid_filter_config(chain))
+        chain[-1] = {'config': {'N': [u'1']}, 'filter': u'select_first_n'}
+        self.assertFalse(provider._valid_filter_config(chain))
+
     @patch('octodns_ns1.Ns1Provider._monitors_for')
     def test_params_for_dynamic_with_pool_status(self, monitors_for_mock):
         provider = Ns1Provider('test', 'api-key')
@@ -1670,7 +1794,14 @@ class TestNs1ProviderDynamic(TestCase):
         rule1['geos'] = ['SA']
         ret, monitor_ids = provider._params_for_A(record)
         self.assertEqual(10, len(ret['answers']))
-        self.assertEqual(ret['filters'], provider._FILTER_CHAIN_WITH_REGION)
+        self.assertEqual(
+            ret['filters'], list(provider._FILTER_CHAIN_WITH_REGION)
+        )
+        # the constants are frozen, what we send to the API needs to be plain,
+        # serializable, dicts
+        for f in ret['filters']:
+            self.assertIs(dict, type(f))
+            self.assertIs(dict, type(f['config']))
         self.assertEqual(
             {
                 'iad__catchall': {'meta': {'note': 'rule-order:2'}},
@@ -1722,7 +1853,7 @@ class TestNs1ProviderDynamic(TestCase):
         rule1['geos'] = ['NA-US-CA', 'NA-CA-NL']
         ret, _ = provider._params_for_A(record)
         self.assertEqual(10, len(ret['answers']))
-        exp = provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY
+        exp = list(provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY)
         self.assertEqual(ret['filters'], exp)
         self.assertEqual(
             {
@@ -1780,7 +1911,7 @@ class TestNs1ProviderDynamic(TestCase):
         )
         ret, _ = provider._params_for_A(record)
         self.assertEqual(4, len(ret['answers']))
-        exp = provider._FILTER_CHAIN_WITH_SUBNET
+        exp = list(provider._FILTER_CHAIN_WITH_SUBNET)
         self.assertEqual(ret['filters'], exp)
         exp_regions = {
             'iad__catchall': {'meta': {'note': 'rule-order:1'}},
@@ -1879,7 +2010,7 @@ class TestNs1ProviderDynamic(TestCase):
         )
 
         # We have both country and region filter chain entries
-        exp = provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY
+        exp = list(provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY)
         self.assertEqual(ret['filters'], exp)
 
         # and our region details match the expected behaviors/targeting
@@ -1947,7 +2078,7 @@ class TestNs1ProviderDynamic(TestCase):
         )
         ret, _ = provider._params_for_A(record)
         self.assertEqual(6, len(ret['answers']))
-        exp = provider._FILTER_CHAIN_WITH_REGION_AND_SUBNET
+        exp = list(provider._FILTER_CHAIN_WITH_REGION_AND_SUBNET)
         self.assertEqual(ret['filters'], exp)
         exp_regions = {
             'iad__catchall': {'meta': {'note': 'rule-order:1'}},
@@ -2002,7 +2133,7 @@ class TestNs1ProviderDynamic(TestCase):
         )
         ret, _ = provider._params_for_A(record)
         self.assertEqual(6, len(ret['answers']))
-        exp = provider._FILTER_CHAIN_WITH_COUNTRY_AND_SUBNET
+        exp = list(provider._FILTER_CHAIN_WITH_COUNTRY_AND_SUBNET)
         self.assertEqual(ret['filters'], exp)
         exp_regions = {
             'iad__catchall': {'meta': {'note': 'rule-order:1'}},
@@ -2063,7 +2194,7 @@ class TestNs1ProviderDynamic(TestCase):
         )
         ret, _ = provider._params_for_A(record)
         self.assertEqual(8, len(ret['answers']))
-        exp = provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY_AND_SUBNET
+        exp = list(provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY_AND_SUBNET)
         self.assertEqual(ret['filters'], exp)
         exp_regions = {
             'iad__catchall': {'meta': {'note': 'rule-order:1'}},
@@ -2122,7 +2253,9 @@ class TestNs1ProviderDynamic(TestCase):
 
         # When rules has 'OC', it is converted to list of countries in the
         # params. Look if the returned filters is the filter chain with country
-        self.assertEqual(ret['filters'], provider._FILTER_CHAIN_WITH_COUNTRY)
+        self.assertEqual(
+            ret['filters'], list(provider._FILTER_CHAIN_WITH_COUNTRY)
+        )
 
     @patch('octodns_ns1.Ns1Provider._monitor_sync')
     @patch('octodns_ns1.Ns1Provider._monitors_for')
@@ -2138,7 +2271,8 @@ class TestNs1ProviderDynamic(TestCase):
         monitors_sync_mock.reset_mock()
         monitors_for_mock.side_effect = [{'3.4.5.6': 'mid-3'}]
         monitors_sync_mock.side_effect = [
-            ('mid-1', 'fid-1'),
+            # no feed, the value still shouldn't be synced a 2nd time
+            ('mid-1', None),
             ('mid-2', 'fid-2'),
             ('mid-3', 'fid-3'),
         ]
@@ -2155,7 +2289,7 @@ class TestNs1ProviderDynamic(TestCase):
         # Given that record has both country and region in the rules,
         # the returned filter chain should be one with region and country
         self.assertEqual(
-            ret['filters'], provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY
+            ret['filters'], list(provider._FILTER_CHAIN_WITH_REGION_AND_COUNTRY)
         )
 
         monitors_for_mock.assert_has_calls([call(record)])
@@ -2166,6 +2300,7 @@ class TestNs1ProviderDynamic(TestCase):
                 call(record, '3.4.5.6', 'mid-3'),
             ]
         )
+        self.assertEqual(3, monitors_sync_mock.call_count)
 
         record = Record.new(
             self.zone,
@@ -2381,8 +2516,9 @@ class TestNs1ProviderDynamic(TestCase):
             'country'
         ] = partial_oc_cntry_list
         data4 = provider._data_for_A('A', ns1_record)
+        geos = data4['dynamic']['rules'][0]['geos']
         for c in partial_oc_cntry_list:
-            self.assertTrue(f'OC-{c}' in data4['dynamic']['rules'][0]['geos'])
+            self.assertIn(f'OC-{c}', geos)
 
         # NA test cases
         # 1. Full list of countries should return 'NA' in geos
@@ -2400,8 +2536,9 @@ class TestNs1ProviderDynamic(TestCase):
             'country'
         ] = partial_na_cntry_list
         data6 = provider._data_for_A('A', ns1_record)
+        geos = data6['dynamic']['rules'][0]['geos']
         for c in partial_na_cntry_list:
-            self.assertTrue(f'NA-{c}' in data6['dynamic']['rules'][0]['geos'])
+            self.assertIn(f'NA-{c}', geos)
 
         # Test out fallback only pools and new-style notes
         ns1_record = {
@@ -2865,7 +3002,8 @@ class TestNs1ProviderDynamic(TestCase):
                     "zone": "unit.tests",
                     "type": "A",
                     "tier": 3,
-                    "filters": provider._BASIC_FILTER_CHAIN,
+                    # the chain constants are read-only, we need to modify
+                    "filters": [dict(f) for f in provider._BASIC_FILTER_CHAIN],
                 }
             ]
         }
@@ -2879,6 +3017,8 @@ class TestNs1ProviderDynamic(TestCase):
         }
         extra = provider._extra_changes(desired, [])
         self.assertFalse(extra)
+        # and the record's filters weren't modified in the process
+        self.assertIs(False, ns1_record['filters'][0]['disabled'])
 
         # disabled=True in filters does trigger an update
         ns1_zone['records'][0]['filters'][0]['disabled'] = True
@@ -2886,6 +3026,36 @@ class TestNs1ProviderDynamic(TestCase):
         extra = provider._extra_changes(desired, [])
         self.assertTrue(extra)
 
+        # multiple dynamic records are each checked against their own filters
+        reset()
+        dynamic2 = Record.new(
+            desired,
+            'dyn2',
+            {
+                'dynamic': {
+                    'pools': {'iad': {'values': [{'value': '1.2.3.5'}]}},
+                    'rules': [{'pool': 'iad'}],
+                },
+                'ttl': 32,
+                'type': 'A',
+                'value': '1.2.3.5',
+            },
+        )
+        desired.add_record(dynamic2)
+        provider.record_filters[dynamic.fqdn[:-1]] = {
+            dynamic._type: provider._BASIC_FILTER_CHAIN
+        }
+        # nothing known for dyn2's domain
+        provider.record_filters.pop(dynamic2.fqdn[:-1], None)
+        gend = provider._monitor_gen(dynamic, '1.2.3.4')
+        gend.update({'id': 'mid', 'notify_list': 'xyz'})
+        gend2 = provider._monitor_gen(dynamic2, '1.2.3.5')
+        gend2.update({'id': 'mid2', 'notify_list': 'xyz'})
+        monitors_for_mock.side_effect = [{'1.2.3.4': gend}, {'1.2.3.5': gend2}]
+        extra = provider._extra_changes(desired, [])
+        # only dyn2, which has no filters, needs an update
+        self.assertEqual([dynamic2], [e.new for e in extra])
+
     DESIRED = Zone('unit.tests.', [])
 
     SIMPLE = Record.new(
@@ -2916,6 +3086,34 @@ class TestNs1ProviderDynamic(TestCase):
         },
     )
 
+    def test_force_root_ns_update(self):
+        provider = Ns1Provider('test', 'api-key')
+        zone = Zone('unit.tests.', [])
+
+        root_ns = Record.new(
+            zone, '', {'ttl': 42, 'type': 'NS', 'values': ['ns1.foo.']}
+        )
+        sub_ns = Record.new(
+            zone, 'sub', {'ttl': 42, 'type': 'NS', 'values': ['ns1.foo.']}
+        )
+        root_a = Record.new(
+            zone, '', {'ttl': 42, 'type': 'A', 'value': '1.2.3.4'}
+        )
+
+        # Only the root NS create is swapped for an update
+        changes = provider._force_root_ns_update(
+            [Create(sub_ns), Create(root_a), Create(root_ns)]
+        )
+        self.assertEqual(
+            [Create, Create, Update], [c.__class__ for c in changes]
+        )
+        self.assertEqual(root_ns, changes[2].new)
+        self.assertIsNone(changes[2].existing)
+
+        # No root NS create, nothing changes
+        changes = [Create(sub_ns), Update(root_ns, root_ns)]
+        self.assertEqual(changes, provider._force_root_ns_update(list(changes)))
+
     def test_has_dynamic(self):
         provider = Ns1Provider('test', 'api-key')
 
@@ -2973,6 +3171,130 @@ class TestNs1ProviderDynamic(TestCase):
             [call('foo', dynamic_update), call('foo', simple_update)]
         )
 
+    @patch('octodns_ns1.Ns1Client.monitors_list')
+    @patch('octodns_ns1.Ns1Client.zones_retrieve')
+    @patch('octodns_ns1.Ns1Provider._apply_Update')
+    def test_apply_parallel(
+        self, apply_update_mock, zones_retrieve_mock, monitors_list_mock
+    ):
+        provider = Ns1Provider(
+            'test', 'api-key', apply_workers=4, monitor_regions=['lga']
+        )
+        # pre-fill caches to avoid extranious calls
+        provider._client._datasource_id = 'foo'
+        provider._client._feeds_for_monitors = {}
+        provider._client._notifylists_cache = {}
+
+        simple_update = Update(self.SIMPLE, self.SIMPLE)
+        dynamic_update = Update(self.DYNAMIC, self.DYNAMIC)
+        plan = Plan(
+            self.DESIRED, self.DESIRED, [simple_update, dynamic_update], True
+        )
+        zones_retrieve_mock.side_effect = ['foo', 'foo']
+        monitors_list_mock.side_effect = [[]]
+
+        # Everything is applied, shared caches are warmed first
+        provider._apply(plan)
+        self.assertEqual(2, apply_update_mock.call_count)
+        apply_update_mock.assert_has_calls(
+            [call('foo', simple_update), call('foo', dynamic_update)],
+            any_order=True,
+        )
+        monitors_list_mock.assert_called_once()
+        self.assertEqual({}, provider._client._monitors_by_host_type)
+
+        # Failures are raised
+        apply_update_mock.reset_mock()
+        apply_update_mock.side_effect = [None, Ns1Exception('boom')]
+        with self.assertRaises(Ns1Exception) as ctx:
+            provider._apply(plan)
+        self.assertEqual('boom', str(ctx.exception))
+        self.assertEqual(2, apply_update_mock.call_count)
+
+        # Nothing dynamic, no need for any of the monitoring bits
+        provider._client.reset_caches()
+        apply_update_mock.reset_mock()
+        apply_update_mock.side_effect = None
+        zones_retrieve_mock.side_effect = ['foo']
+        plan = Plan(
+            self.DESIRED, self.DESIRED, [simple_update, simple_update], True
+        )
+        provider._apply(plan)
+        self.assertEqual(2, apply_update_mock.call_count)
+        self.assertIsNone(provider._client._monitors_cache)
+
+        # parallelism, which is about rate-limit pacing, doesn't fan out
+        provider = Ns1Provider('test', 'api-key', parallelism=4)
+        zones_retrieve_mock.side_effect = ['foo']
+        apply_update_mock.reset_mock()
+        with patch('octodns_ns1.ThreadPoolExecutor') as executor_mock:
+            provider._apply(plan)
+        executor_mock.assert_not_called()
+        self.assertEqual(2, apply_update_mock.call_count)
+
+    @patch('octodns_ns1.Ns1Client.zones_retrieve')
+    @patch('octodns_ns1.Ns1Provider._apply_Update')
+    @patch('octodns_ns1.Ns1Provider._apply_Create')
+    @patch('octodns_ns1.Ns1Provider._apply_Delete')
+    def test_apply_parallel_phases(
+        self,
+        apply_delete_mock,
+        apply_create_mock,
+        apply_update_mock,
+        zones_retrieve_mock,
+    ):
+        provider = Ns1Provider('test', 'api-key', apply_workers=4)
+        zones_retrieve_mock.return_value = 'foo'
+
+        zone = Zone('unit.tests.', [])
+        root_ns = Record.new(
+            zone,
+            '',
+            {'ttl': 30, 'type': 'NS', 'values': ['ns1.foo.', 'ns2.foo.']},
+        )
+        a = {'ttl': 30, 'type': 'A', 'value': '1.2.3.4'}
+        cname = {'ttl': 30, 'type': 'CNAME', 'value': 'foo.unit.tests.'}
+        www_a = Record.new(zone, 'www', a)
+        www_cname = Record.new(zone, 'www', cname)
+        other = Record.new(zone, 'other', a)
+        another = Record.new(zone, 'another', a)
+        changes = [
+            Delete(www_a),
+            Create(www_cname),
+            Create(another),
+            Update(other, other),
+            Update(root_ns, root_ns),
+        ]
+        plan = Plan(zone, zone, changes, True)
+
+        order = []
+
+        def record(kind):
+            def _apply(ns1_zone, change):
+                order.append((kind, change.record.name))
+
+            return _apply
+
+        apply_delete_mock.side_effect = record('delete')
+        apply_create_mock.side_effect = record('create')
+        apply_update_mock.side_effect = record('update')
+
+        provider._apply(plan)
+        # root NS update, then deletes, one at a time and in that order
+        self.assertEqual([('update', ''), ('delete', 'www')], order[:2])
+        # then all of the creates, in either order, before the other update
+        self.assertEqual(
+            {('create', 'www'), ('create', 'another')}, set(order[2:4])
+        )
+        self.assertEqual([('update', 'other')], order[4:])
+
+        # a failed create stops the updates from being applied
+        order.clear()
+        apply_create_mock.side_effect = Ns1Exception('boom')
+        with self.assertRaises(Ns1Exception):
+            provider._apply(plan)
+        self.assertEqual([('update', ''), ('delete', 'www')], order)
+
 
 class TestNs1Client(TestCase):
     @patch('ns1.rest.zones.Zones.retrieve')
@@ -2984,7 +3306,7 @@ class TestNs1Client(TestCase):
         zone_retrieve_mock.reset_mock()
         zone_retrieve_mock.side_effect = ['foo']
         self.assertEqual('foo', client.zones_retrieve('unit.tests'))
-        zone_retrieve_mock.assert_has_calls([call('unit.tests')])
+        zone_retrieve_mock.assert_called_once_with('unit.tests')
 
         # One retry required
         client.reset_caches()
@@ -2994,17 +3316,20 @@ class TestNs1Client(TestCase):
             'foo',
         ]
         self.assertEqual('foo', client.zones_retrieve('unit.tests'))
-        zone_retrieve_mock.assert_has_calls([call('unit.tests')])
+        zone_retrieve_mock.assert_has_calls([call('unit.tests')] * 2)
+        self.assertEqual(2, zone_retrieve_mock.call_count)
 
         # Two retries required
         client.reset_caches()
         zone_retrieve_mock.reset_mock()
         zone_retrieve_mock.side_effect = [
+            RateLimitException('boo', period=0),
             RateLimitException('boo', period=0),
             'foo',
         ]
         self.assertEqual('foo', client.zones_retrieve('unit.tests'))
-        zone_retrieve_mock.assert_has_calls([call('unit.tests')])
+        zone_retrieve_mock.assert_has_calls([call('unit.tests')] * 3)
+        self.assertEqual(3, zone_retrieve_mock.call_count)
 
         # Exhaust our retries
         client.reset_caches()
@@ -3018,6 +3343,198 @@ class TestNs1Client(TestCase):
         with self.assertRaises(RateLimitException) as ctx:
             client.zones_retrieve('unit.tests')
         self.assertEqual('last', str(ctx.exception))
+        self.assertEqual(4, zone_retrieve_mock.call_count)
+
+    @patch('octodns_ns1.sleep')
+    @patch('ns1.rest.zones.Zones.retrieve')
+    def test_retry_behavior_paced(self, zone_retrieve_mock, sleep_mock):
+        client = Ns1Client('dummy-key')
+
+        # When we've seen the limits in response headers a 429 puts the
+        # bucket into debt and we pace the retry rather than sleeping for the
+        # full period
+        client._zones._transport._rateLimitHeaders(
+            {
+                'X-RateLimit-Limit': '10',
+                'X-RateLimit-Period': '100',
+                'X-RateLimit-Remaining': '5',
+            }
+        )
+        zone_retrieve_mock.side_effect = [
+            RateLimitException('boo', limit=10, period=100, remaining=0),
+            'foo',
+        ]
+        self.assertEqual('foo', client.zones_retrieve('unit.tests'))
+        self.assertEqual(2, zone_retrieve_mock.call_count)
+        sleep_mock.assert_called_once()
+        wait = sleep_mock.call_args[0][0]
+        # debt of -1 after the penalty, 1 token consumed, 0.1 tokens per second
+        self.assertTrue(19 < wait <= 20, wait)
+        self.assertEqual(10, client._bucket.capacity)
+        self.assertEqual(0.1, client._bucket.rate)
+
+    @patch('octodns_ns1.monotonic')
+    @patch('octodns_ns1.sleep')
+    def test_token_bucket(self, sleep_mock, monotonic_mock):
+        monotonic_mock.return_value = 0
+        bucket = TokenBucket()
+
+        # Nothing known about the limits, no pacing
+        bucket.acquire()
+        sleep_mock.assert_not_called()
+        self.assertIsNone(bucket.rate)
+
+        # Missing limit information is ignored
+        self.assertFalse(bucket.tune(None, 1, 5))
+        self.assertFalse(bucket.tune(10, 0, 5))
+        self.assertFalse(bucket.penalize())
+        self.assertIsNone(bucket.rate)
+
+        # 10 requests per 5s with 2 remaining, those go through immediately
+        self.assertTrue(bucket.tune(10, 5, 2))
+        self.assertEqual(10, bucket.capacity)
+        self.assertEqual(2, bucket.rate)
+        bucket.acquire()
+        bucket.acquire()
+        sleep_mock.assert_not_called()
+
+        # The next one has to wait for a token to be refilled
+        bucket.acquire()
+        sleep_mock.assert_called_once_with(0.5)
+
+        # Time passes, refills, but never beyond capacity
+        sleep_mock.reset_mock()
+        monotonic_mock.return_value = 100
+        bucket.acquire()
+        sleep_mock.assert_not_called()
+        self.assertEqual(9, bucket.tokens)
+
+        # A 429 puts the bucket into debt
+        self.assertTrue(bucket.penalize())
+        self.assertEqual(-1, bucket.tokens)
+        bucket.acquire()
+        sleep_mock.assert_called_once_with(1.0)
+
+        # The SDK's header parsing is wrapped so we see every response's
+        # limits, the original's result is passed along
+        rl = {'by': 'customer', 'limit': 20, 'period': 2, 'remaining': 15}
+        func = bucket.rate_limit_headers(lambda headers: rl)
+        headers = {'X-RateLimit-Limit': '20', 'X-RateLimit-Period': '2'}
+        self.assertEqual(rl, func(headers))
+        self.assertEqual(20, bucket.capacity)
+        self.assertEqual(10, bucket.rate)
+        self.assertEqual(15, bucket.tokens)
+
+        # Responses without the headers get the SDK's defaults, those don't
+        # retune
+        defaults = {'by': 'customer', 'limit': 10, 'period': 1, 'remaining': 1}
+        func = bucket.rate_limit_headers(lambda headers: defaults)
+        self.assertEqual(defaults, func({}))
+        self.assertEqual(20, bucket.capacity)
+        self.assertEqual(10, bucket.rate)
+
+    def test_client_rate_limit_hooks(self):
+        client = Ns1Client('dummy-key')
+        headers = {
+            'X-RateLimit-Limit': '50',
+            'X-RateLimit-Period': '10',
+            'X-RateLimit-Remaining': '42',
+        }
+        resources = (
+            client._records,
+            client._zones,
+            client._monitors,
+            client._notifylists,
+            client._datasource,
+            client._datafeed,
+        )
+        for resource in resources:
+            client._bucket.rate = None
+            # no headers, nothing learned
+            resource._transport._rateLimitHeaders({})
+            self.assertIsNone(client._bucket.rate)
+            rl = resource._transport._rateLimitHeaders(headers)
+            self.assertEqual(50, rl['limit'])
+            self.assertEqual(5, client._bucket.rate)
+            self.assertEqual(42, client._bucket.tokens)
+
+        # When the SDK's concurrent strategy is pacing requests the bucket
+        # stays out of the way
+        client = Ns1Client('dummy-key', parallelism=3)
+        client._records._transport._rateLimitHeaders(headers)
+        client._zones._transport._rateLimitHeaders(headers)
+        self.assertIsNone(client._bucket.rate)
+
+    def test_client_shared_connection_pool(self):
+        def adapters(client):
+            return {
+                resource._transport.session.get_adapter('https://x/')
+                for resource in (
+                    client._records,
+                    client._zones,
+                    client._monitors,
+                    client._notifylists,
+                    client._datasource,
+                    client._datafeed,
+                )
+            }
+
+        # All of the resources share one adapter, and so its pool
+        got = adapters(Ns1Client('dummy-key'))
+        self.assertEqual(1, len(got))
+        self.assertEqual(10, got.pop()._pool_maxsize)
+
+        # Sized to allow for parallelism
+        got = adapters(Ns1Client('dummy-key', parallelism=16))
+        self.assertEqual(1, len(got))
+        self.assertEqual(16, got.pop()._pool_maxsize)
+
+        # and for fetch_workers
+        got = adapters(Ns1Client('dummy-key', fetch_workers=12))
+        self.assertEqual(12, got.pop()._pool_maxsize)
+
+        # Transports w/o a session are left alone
+        client = Ns1Client('dummy-key', client_config={'transport': 'basic'})
+        self.assertFalse(hasattr(client._records._transport, 'session'))
+
+    @patch('octodns_ns1.Ns1Client.log')
+    @patch('ns1.rest.zones.Zones.retrieve')
+    def test_try_error_logging(self, zone_retrieve_mock, log_mock):
+        client = Ns1Client('dummy-key')
+        zone_retrieve_mock.__name__ = 'retrieve'
+
+        # 404s are expected, e.g. zone not found, and aren't logged. Real
+        # responses are falsey for error status codes
+        class DummyResponse:
+            def __init__(self, status_code):
+                self.status_code = status_code
+
+            def __bool__(self):
+                return False
+
+        zone_retrieve_mock.side_effect = ResourceException(
+            'server error', response=DummyResponse(404), body='x'
+        )
+        with self.assertRaises(ResourceException):
+            client.zones_retrieve('unit.tests')
+        log_mock.error.assert_not_called()
+        log_mock.exception.assert_not_called()
+
+        # Anything else is logged, without a traceback
+        zone_retrieve_mock.side_effect = ResourceException(
+            'server error', response=DummyResponse(500), body='x'
+        )
+        with self.assertRaises(ResourceException):
+            client.zones_retrieve('unit.tests')
+        log_mock.error.assert_called_once()
+        log_mock.exception.assert_not_called()
+
+        # As are errors without a response
+        log_mock.reset_mock()
+        zone_retrieve_mock.side_effect = ResourceException('boom')
+        with self.assertRaises(ResourceException):
+            client.zones_retrieve('unit.tests')
+        log_mock.error.assert_called_once()
 
     def test_client_config(self):
         with self.assertRaises(TypeError):
@@ -3038,6 +3555,12 @@ class TestNs1Client(TestCase):
         )
         self.assertEqual(client._client.config.get('parallelism'), 11)
 
+        # parallelism beyond the max is clamped
+        with self.assertLogs('NS1Client', 'WARNING') as cm:
+            client = Ns1Client('dummy-key', parallelism=64)
+        self.assertEqual(client._client.config.get('parallelism'), 16)
+        self.assertIn('clamping to 16', cm.output[0])
+
         client = Ns1Client(
             'dummy-key',
             client_config={
@@ -3050,6 +3573,50 @@ class TestNs1Client(TestCase):
         )
         self.assertEqual(client._client.config.get('follow_pagination'), False)
 
+    @patch('ns1.rest.records.Records.retrieve')
+    def test_records_retrieve_many(self, record_retrieve_mock):
+        def retrieve(zone, domain, _type):
+            return {'domain': domain, 'type': _type, 'zone': zone}
+
+        record_retrieve_mock.side_effect = retrieve
+        domain_types = [(f'{i}.unit.tests', 'A') for i in range(5)]
+        expected = [
+            {'domain': d, 'type': t, 'zone': 'unit.tests'}
+            for d, t in domain_types
+        ]
+
+        # by default they're fetched one at a time, parallelism, which is
+        # about rate-limit pacing, doesn't change that
+        client = Ns1Client('dummy-key', parallelism=3)
+        self.assertEqual(1, client.fetch_workers)
+        with patch('octodns_ns1.ThreadPoolExecutor') as executor_mock:
+            self.assertEqual(
+                expected,
+                client.records_retrieve_many('unit.tests', domain_types),
+            )
+        executor_mock.assert_not_called()
+        self.assertEqual(5, record_retrieve_mock.call_count)
+        self.assertEqual([], client.records_retrieve_many('unit.tests', []))
+
+        # the provider passes the option along
+        provider = Ns1Provider('test', 'api-key', fetch_workers=3)
+        self.assertEqual(3, provider._client.fetch_workers)
+
+        # with fetch_workers they're spread across threads, results are still
+        # in order
+        # and cached
+        record_retrieve_mock.reset_mock()
+        client = Ns1Client('dummy-key', fetch_workers=3)
+        self.assertEqual(
+            expected, client.records_retrieve_many('unit.tests', domain_types)
+        )
+        self.assertEqual(5, record_retrieve_mock.call_count)
+        self.assertEqual(
+            expected[2],
+            client.records_retrieve('unit.tests', '2.unit.tests', 'A'),
+        )
+        self.assertEqual(5, record_retrieve_mock.call_count)
+
     @patch('ns1.rest.data.Source.list')
     @patch('ns1.rest.data.Source.create')
     def test_datasource_id(self, datasource_create_mock, datasource_list_mock):
@@ -3139,6 +3706,25 @@ class TestNs1Client(TestCase):
         client.datafeed_delete(client.datasource_id, 'new-feed')
         self.assertEqual(expected, client.feeds_for_monitors)
         datafeed_delete_mock.assert_called_once()
+        # the reverse index was built and kept in sync
+        self.assertEqual(
+            {'the-feed': 'the-job', 'the-other-feed': 'the-other-job'},
+            client.monitors_for_feeds,
+        )
+
+        # Create with the reverse index built keeps it up to date
+        datafeed_create_mock.side_effect = [{'id': 'newer-feed'}]
+        client.datafeed_create(
+            client.datasource_id, 'newer-name', {'jobid': 'newer-job'}
+        )
+        self.assertEqual('newer-job', client.monitors_for_feeds['newer-feed'])
+
+        # Deleting a feed we don't know about leaves the caches alone
+        datafeed_delete_mock.reset_mock()
+        client.datafeed_delete(client.datasource_id, 'unknown-feed')
+        datafeed_delete_mock.assert_called_once()
+        self.assertEqual(3, len(client.feeds_for_monitors))
+        self.assertEqual(3, len(client.monitors_for_feeds))
 
     @patch('ns1.rest.monitoring.Monitors.delete')
     @patch('ns1.rest.monitoring.Monitors.update')
@@ -3198,6 +3784,58 @@ class TestNs1Client(TestCase):
         monitors_delete_mock.assert_has_calls([call('new-id')])
         self.assertEqual(expected, client.monitors)
 
+        # Deleting with a cold cache doesn't fetch the monitors
+        client.reset_caches()
+        monitors_list_mock.reset_mock()
+        monitors_delete_mock.side_effect = ['deleted']
+        self.assertEqual('deleted', client.monitors_delete('one'))
+        monitors_list_mock.assert_not_called()
+        self.assertIsNone(client._monitors_cache)
+
+        # Index by the host & type in the notes, skipping those w/o notes
+        client.reset_caches()
+        a = {'id': 'a', 'notes': 'host:unit.tests type:A value:1.2.3.4'}
+        b = {'id': 'b', 'notes': 'host:unit.tests type:A value:2.3.4.5'}
+        c = {'id': 'c', 'notes': 'host:www.unit.tests type:A'}
+        monitors_list_mock.side_effect = [[a, b, c, one]]
+        self.assertEqual(
+            {('unit.tests', 'A'): [a, b], ('www.unit.tests', 'A'): [c]},
+            client.monitors_by_host_type,
+        )
+
+        # Creates, updates, and deletes keep it in sync
+        d = {'id': 'd', 'notes': 'host:unit.tests type:AAAA'}
+        monitors_create_mock.side_effect = [d]
+        client.monitors_create(param='eter')
+        moved = {'id': 'c', 'notes': 'host:unit.tests type:AAAA'}
+        monitors_update_mock.side_effect = [moved]
+        client.monitors_update('c', notes=moved['notes'])
+        monitors_delete_mock.side_effect = ['deleted']
+        client.monitors_delete('a')
+        self.assertEqual(
+            {
+                ('unit.tests', 'A'): [b],
+                ('unit.tests', 'AAAA'): [d, moved],
+                ('www.unit.tests', 'A'): [],
+            },
+            client.monitors_by_host_type,
+        )
+
+        # Monitors w/o notes come and go without touching it
+        e = {'id': 'e', 'key': 'value'}
+        monitors_create_mock.side_effect = [e]
+        client.monitors_create(param='eter')
+        monitors_delete_mock.side_effect = ['deleted']
+        client.monitors_delete('e')
+        self.assertEqual(
+            [
+                ('unit.tests', 'A'),
+                ('unit.tests', 'AAAA'),
+                ('www.unit.tests', 'A'),
+            ],
+            sorted(client.monitors_by_host_type.keys()),
+        )
+
     @patch('ns1.rest.monitoring.NotifyLists.delete')
     @patch('ns1.rest.monitoring.NotifyLists.create')
     @patch('ns1.rest.monitoring.NotifyLists.list')
@@ -3243,12 +3881,32 @@ class TestNs1Client(TestCase):
             # This one comes 2nd on purpose
             'the-one': {'id': 'nlid', 'name': 'the-one'},
         }
+        # the reverse index will be rebuilt from the cache
+        client._notifylist_names = None
         client.notifylists_delete('nlid')
         notifylists_list_mock.assert_not_called()
         notifylists_create_mock.assert_not_called()
         notifylists_delete_mock.assert_has_calls([call('nlid')])
         # Only another left
-        self.assertEqual(['another'], list(client._notifylists_cache.keys()))
+        self.assertEqual({'another'}, client._notifylists_cache.keys())
+        self.assertEqual({'notid': 'another'}, client.notifylist_names)
+
+        # Creating with the reverse index built keeps it up to date
+        reset()
+        notifylists_create_mock.side_effect = [{'id': 'new-id', 'name': 'new'}]
+        client.notifylists_create(name='new', notify_list=notify_list)
+        self.assertEqual(
+            {'notid': 'another', 'new-id': 'new'}, client.notifylist_names
+        )
+        self.assertEqual({'another', 'new'}, client._notifylists_cache.keys())
+
+        # Deleting with a cold cache doesn't fetch the notify lists
+        reset()
+        client.reset_caches()
+        client.notifylists_delete('nlid')
+        notifylists_list_mock.assert_not_called()
+        notifylists_delete_mock.assert_has_calls([call('nlid')])
+        self.assertIsNone(client._notifylists_cache)
 
         reset()
         expected = ['one', 'two', 'three']
@@ -3290,23 +3948,36 @@ class TestNs1Client(TestCase):
 
         # Initial zone get fetches and caches
         reset()
-        zone_retrieve_mock.side_effect = ['foo']
-        self.assertEqual('foo', client.zones_retrieve('unit.tests'))
+        unit_tests = {
+            'records': [
+                {
+                    'domain': 'a.unit.tests',
+                    'short_answers': ['1.2.3.4'],
+                    'tier': 1,
+                    'ttl': 30,
+                    'type': 'A',
+                }
+            ]
+        }
+        zone_retrieve_mock.side_effect = [unit_tests]
+        self.assertEqual(unit_tests, client.zones_retrieve('unit.tests'))
         zone_retrieve_mock.assert_has_calls([call('unit.tests')])
-        self.assertEqual({'unit.tests': 'foo'}, client._zones_cache)
+        self.assertEqual({'unit.tests': unit_tests}, client._zones_cache)
 
         # Subsequent zone get does not fetch and returns from cache
         reset()
-        self.assertEqual('foo', client.zones_retrieve('unit.tests'))
+        self.assertEqual(unit_tests, client.zones_retrieve('unit.tests'))
         zone_retrieve_mock.assert_not_called()
 
         # Zone create stores in cache
         reset()
-        zone_create_mock.side_effect = ['bar']
-        self.assertEqual('bar', client.zones_create('sub.unit.tests'))
+        sub_unit_tests = {'records': []}
+        zone_create_mock.side_effect = [sub_unit_tests]
+        self.assertEqual(sub_unit_tests, client.zones_create('sub.unit.tests'))
         zone_create_mock.assert_has_calls([call('sub.unit.tests')])
         self.assertEqual(
-            {'sub.unit.tests': 'bar', 'unit.tests': 'foo'}, client._zones_cache
+            {'sub.unit.tests': sub_unit_tests, 'unit.tests': unit_tests},
+            client._zones_cache,
         )
 
         # Initial record get fetches and caches
@@ -3319,8 +3990,7 @@ class TestNs1Client(TestCase):
             [call('unit.tests', 'a.unit.tests', 'A')]
         )
         self.assertEqual(
-            {'unit.tests': {'a.unit.tests': {'A': 'baz'}}},
-            client._records_cache,
+            {('unit.tests', 'a.unit.tests', 'A'): 'baz'}, client._records_cache
         )
 
         # Subsequent record get does not fetch and returns from cache
@@ -3330,11 +4000,19 @@ class TestNs1Client(TestCase):
         )
         record_retrieve_mock.assert_not_called()
 
-        # Record create stores in cache
+        # Record create stores in cache and patches it into the zone
         reset()
-        record_create_mock.side_effect = ['boo']
+        boo = {
+            'answers': [{'answer': ['2001:db8::1'], 'meta': {}}],
+            'domain': 'aaaa.unit.tests',
+            'filters': [],
+            'tier': 1,
+            'ttl': 31,
+            'type': 'AAAA',
+        }
+        record_create_mock.side_effect = [boo]
         self.assertEqual(
-            'boo',
+            boo,
             client.records_create(
                 'unit.tests', 'aaaa.unit.tests', 'AAAA', key='val'
             ),
@@ -3344,15 +4022,25 @@ class TestNs1Client(TestCase):
         )
         self.assertEqual(
             {
-                'unit.tests': {
-                    'a.unit.tests': {'A': 'baz'},
-                    'aaaa.unit.tests': {'AAAA': 'boo'},
-                }
+                ('unit.tests', 'a.unit.tests', 'A'): 'baz',
+                ('unit.tests', 'aaaa.unit.tests', 'AAAA'): boo,
             },
             client._records_cache,
         )
+        self.assertEqual(
+            {
+                'domain': 'aaaa.unit.tests',
+                'short_answers': ['2001:db8::1'],
+                'tier': 1,
+                'ttl': 31,
+                'type': 'AAAA',
+            },
+            unit_tests['records'][-1],
+        )
+        self.assertEqual(2, len(unit_tests['records']))
+        zone_retrieve_mock.assert_not_called()
 
-        # Record delete removes from cache and removes zone
+        # Record delete removes from cache and from the zone's records
         reset()
         record_delete_mock.side_effect = [{}]
         self.assertEqual(
@@ -3362,18 +4050,13 @@ class TestNs1Client(TestCase):
             [call('unit.tests', 'aaaa.unit.tests', 'AAAA')]
         )
         self.assertEqual(
-            {
-                'unit.tests': {
-                    'a.unit.tests': {'A': 'baz'},
-                    'aaaa.unit.tests': {},
-                }
-            },
-            client._records_cache,
+            {('unit.tests', 'a.unit.tests', 'A'): 'baz'}, client._records_cache
+        )
+        self.assertEqual(
+            ['a.unit.tests'], [r['domain'] for r in unit_tests['records']]
         )
-        self.assertEqual({'sub.unit.tests': 'bar'}, client._zones_cache)
 
-        # Delete the other record, no zone this time, record should still go
-        # away
+        # Delete the other record, the zone is left with no records
         reset()
         record_delete_mock.side_effect = [{}]
         self.assertEqual(
@@ -3382,16 +4065,24 @@ class TestNs1Client(TestCase):
         record_delete_mock.assert_has_calls(
             [call('unit.tests', 'a.unit.tests', 'A')]
         )
-        self.assertEqual(
-            {'unit.tests': {'a.unit.tests': {}, 'aaaa.unit.tests': {}}},
-            client._records_cache,
-        )
-        self.assertEqual({'sub.unit.tests': 'bar'}, client._zones_cache)
+        self.assertEqual({}, client._records_cache)
+        self.assertEqual([], unit_tests['records'])
 
-        # Record update removes zone and caches result
-        record_update_mock.side_effect = ['done']
+        # Record update caches result and patches the zone, the record has
+        # filters so it's summarized as an advanced record
+        reset()
+        done = {
+            'answers': [
+                {'answer': ['2001:db8::2'], 'meta': {'note': 'from:x'}}
+            ],
+            'domain': 'aaaa.sub.unit.tests',
+            'filters': [{'config': {}, 'filter': 'up'}],
+            'ttl': 32,
+            'type': 'AAAA',
+        }
+        record_update_mock.side_effect = [done]
         self.assertEqual(
-            'done',
+            done,
             client.records_update(
                 'sub.unit.tests', 'aaaa.sub.unit.tests', 'AAAA', key='val'
             ),
@@ -3400,13 +4091,32 @@ class TestNs1Client(TestCase):
             [call('sub.unit.tests', 'aaaa.sub.unit.tests', 'AAAA', key='val')]
         )
         self.assertEqual(
-            {
-                'unit.tests': {'a.unit.tests': {}, 'aaaa.unit.tests': {}},
-                'sub.unit.tests': {'aaaa.sub.unit.tests': {'AAAA': 'done'}},
-            },
+            {('sub.unit.tests', 'aaaa.sub.unit.tests', 'AAAA'): done},
             client._records_cache,
         )
+        self.assertEqual(
+            [
+                {
+                    'domain': 'aaaa.sub.unit.tests',
+                    'short_answers': ['2001:db8::2'],
+                    'tier': 3,
+                    'ttl': 32,
+                    'type': 'AAAA',
+                }
+            ],
+            sub_unit_tests['records'],
+        )
+
+        # Record update in a zone we haven't cached leaves the zones cache
+        # alone
+        reset()
+        client._zones_cache = {}
+        record_update_mock.side_effect = [done]
+        client.records_update(
+            'other.tests', 'aaaa.other.tests', 'AAAA', key='val'
+        )
         self.assertEqual({}, client._zones_cache)
+        zone_retrieve_mock.assert_not_called()
 
     def test_parse_rule_geos_special_cases(self):
         provider = Ns1Provider('test', 'api-key')
@@ -3425,6 +4135,23 @@ class TestNs1Client(TestCase):
         geos = provider._parse_rule_geos(meta, notes)
         self.assertEqual({'OC-PN', 'OC-UM'}, geos)
 
+    def test_parse_rules_order_collision(self):
+        provider = Ns1Provider('test', 'api-key')
+
+        # Two pools claiming the same rule-order, whichever order the API
+        # hands them to us in the lowest one is the rule's pool
+        lhr = {'meta': {'note': 'rule-order:1', 'country': ['GB']}}
+        iad = {'meta': {'note': 'rule-order:1', 'country': ['US']}}
+        for regions in (
+            {'lhr__country': lhr, 'iad__country': iad},
+            {'iad__country': iad, 'lhr__country': lhr},
+        ):
+            rules = provider._parse_rules({}, regions)
+            self.assertEqual(
+                [{'pool': 'iad', '_order': 1, 'geos': ['EU-GB', 'NA-US']}],
+                rules,
+            )
+
     @patch('ns1.rest.zones.Zones.list')
     def test_zones_list(self, mock):
         data = [
@@ -3437,3 +4164,80 @@ class TestNs1Client(TestCase):
 
         self.assertEqual(data, provider._client.zones_list())
         self.assertEqual(['first.com.', 'other.net.'], provider.list_zones())
+
+    @patch('ns1.rest.zones.Zones.create')
+    @patch('ns1.rest.zones.Zones.retrieve')
+    @patch('ns1.rest.zones.Zones.list')
+    def test_zones_list_existence(
+        self, zones_list_mock, zones_retrieve_mock, zones_create_mock
+    ):
+        provider = Ns1Provider('test', 'api-key')
+        client = provider._client
+
+        # Before listing we have to ask
+        zones_retrieve_mock.side_effect = [{'records': []}]
+        client.zones_retrieve('first.com')
+        zones_retrieve_mock.assert_called_once()
+
+        # Once we've listed the zones, those that aren't there are known not
+        # to exist without asking the API
+        zones_list_mock.side_effect = [
+            [{'zone': 'first.com'}, {'zone': 'other.net'}]
+        ]
+        self.assertEqual(['first.com.', 'other.net.'], provider.list_zones())
+        zones_retrieve_mock.reset_mock()
+        with self.assertRaises(ResourceException) as ctx:
+            client.zones_retrieve('missing.org')
+        self.assertEqual(provider.ZONE_NOT_FOUND_MESSAGE, ctx.exception.message)
+        # there's one definition, the provider matches what the client raises
+        self.assertIs(
+            Ns1Client.ZONE_NOT_FOUND_MESSAGE, Ns1Provider.ZONE_NOT_FOUND_MESSAGE
+        )
+        zones_retrieve_mock.assert_not_called()
+
+        # populate treats it as a non-existent zone
+        zone = Zone('missing.org.', [])
+        self.assertFalse(provider.populate(zone))
+        zones_retrieve_mock.assert_not_called()
+
+        # Listed zones are still retrieved for their details
+        zones_retrieve_mock.side_effect = [{'records': []}]
+        self.assertEqual({'records': []}, client.zones_retrieve('other.net'))
+        zones_retrieve_mock.assert_called_once_with('other.net')
+
+        # Creating a zone adds it to the known names
+        zones_create_mock.side_effect = [{'records': []}]
+        client.zones_create('missing.org')
+        self.assertIn('missing.org', client._zone_names)
+        self.assertEqual({'records': []}, client.zones_retrieve('missing.org'))
+
+    @patch('ns1.rest.zones.Zones.create')
+    @patch('ns1.rest.zones.Zones.retrieve')
+    def test_zones_retrieve_missing(
+        self, zones_retrieve_mock, zones_create_mock
+    ):
+        client = Ns1Client('dummy-key')
+        # _try logs the name of the method that failed
+        zones_retrieve_mock.__name__ = 'retrieve'
+
+        # A zone that isn't found is remembered
+        zones_retrieve_mock.side_effect = ResourceException(
+            'server error: zone not found'
+        )
+        for _ in range(2):
+            with self.assertRaises(ResourceException):
+                client.zones_retrieve('missing.org')
+        zones_retrieve_mock.assert_called_once_with('missing.org')
+
+        # Other errors aren't
+        zones_retrieve_mock.reset_mock()
+        zones_retrieve_mock.side_effect = ResourceException('boom')
+        for _ in range(2):
+            with self.assertRaises(ResourceException):
+                client.zones_retrieve('other.org')
+        self.assertEqual(2, zones_retrieve_mock.call_count)
+
+        # Until it's created
+        zones_create_mock.side_effect = [{'records': []}]
+        client.zones_create('missing.org')
+        self.assertEqual({'records': []}, client.zones_retrieve('missing.org'))